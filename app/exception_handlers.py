@@ -6,6 +6,9 @@ from fastapi.responses import JSONResponse
 
 class InvalidInputException(Exception):
     def __init__(self, name: str, value: str):
+        # Passing the arguments on lets the exception be pickled back from
+        # the worker processes of /chem/all_filters
+        super().__init__(name, value)
         self.name = name
         self.value = value
 
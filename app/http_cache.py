@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from typing import Callable
+
+from fastapi import Request
+from fastapi.responses import Response
+from fastapi.routing import APIRoute
+
+CACHE_CONTROL = "public, max-age=86400, immutable"
+
+
+def cacheable(gzip: bool = False) -> Callable:
+    """Mark an endpoint as a pure function of its query parameters.
+
+    Marked GET endpoints on a router using CacheableRoute answer with an ETag
+    and a Cache-Control header, and with 304 Not Modified if the client sends
+    a matching If-None-Match header.
+
+    Args:
+        gzip (bool): Whether the endpoint sends a gzip encoded response to
+            clients accepting it (see accepts_gzip). The encoded variant gets
+            its own ETag. Defaults to False.
+
+    Returns:
+        Callable: The decorator.
+    """
+
+    def decorator(endpoint: Callable) -> Callable:
+        endpoint.http_cache_gzip = gzip
+        return endpoint
+
+    return decorator
+
+
+def accepts_gzip(request: Request) -> bool:
+    """Check whether the client accepts a gzip encoded response.
+
+    Args:
+        request (Request): The FastAPI Request object.
+
+    Returns:
+        bool: True if gzip, or "*" without gzip, is listed in the
+            Accept-Encoding header with a q-value above 0.
+    """
+    codings = {}
+    for item in request.headers.get("accept-encoding", "").split(","):
+        coding, _, params = item.partition(";")
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        codings[coding.strip().lower()] = quality
+    return codings.get("gzip", codings.get("*", 0.0)) > 0
+
+
+def get_etag(request: Request) -> str:
+    """Compute the ETag of a GET request from its path and query parameters.
+
+    The release version is part of the hash, so cached responses are
+    invalidated by a new deployment.
+
+    Args:
+        request (Request): The FastAPI Request object.
+
+    Returns:
+        str: The quoted ETag.
+    """
+    params = [
+        f"{key}={value}" for key, value in sorted(request.query_params.multi_items())
+    ]
+    key = "\n".join(
+        [os.getenv("RELEASE_VERSION", "1.0"), request.url.path, *params],
+    )
+    return '"' + hashlib.blake2b(key.encode(), digest_size=8).hexdigest() + '"'
+
+
+class CacheableRoute(APIRoute):
+    """APIRoute that adds HTTP caching to endpoints marked as cacheable."""
+
+    def get_route_handler(self) -> Callable:
+        route_handler = super().get_route_handler()
+        gzip = getattr(self.endpoint, "http_cache_gzip", None)
+        if gzip is None:
+            return route_handler
+
+        async def cached_route_handler(request: Request) -> Response:
+            if request.method != "GET":
+                return await route_handler(request)
+
+            etag = get_etag(request)
+            if gzip and accepts_gzip(request):
+                # The encoded body is a different representation
+                etag = etag[:-1] + '-gzip"'
+            headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+            if_none_match = request.headers.get("if-none-match", "")
+            if etag in if_none_match or if_none_match.strip() == "*":
+                return Response(status_code=304, headers=headers)
+
+            response = await route_handler(request)
+            # Errors are not cached, the input may be fixed upstream
+            if response.status_code == 200:
+                response.headers.update(headers)
+            return response
+
+        return cached_route_handler
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import logging
 import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi import status
 from fastapi.middleware.cors import CORSMiddleware
@@ -15,6 +18,7 @@ from .routers import depict
 from .routers import tools
 from app.exception_handlers import input_exception_handler
 from app.exception_handlers import InvalidInputException
+from app.modules.toolkits.cdk_wrapper import setup_jvm
 from app.schemas import HealthCheck
 
 # Import OCSR router if necessary
@@ -62,6 +66,23 @@ app.include_router(tools.router)
 if os.getenv("INCLUDE_OCSR", "true").lower() == "true":
     app.include_router(ocsr.router)
 
+logger = logging.getLogger(__name__)
+
+
+def _log_jvm_startup_failure(future: asyncio.Future) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        logger.error("Starting the JVM failed", exc_info=future.exception())
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Start the JVM in the background, RDKit-only routes can be served while
+    # it boots and the first CDK request does not pay the full start-up cost.
+    app.state.jvm_startup = asyncio.get_running_loop().run_in_executor(None, setup_jvm)
+    app.state.jvm_startup.add_done_callback(_log_jvm_startup_failure)
+    yield
+
+
 app = VersionedFastAPI(
     app,
     version_format="{major}",
@@ -78,6 +99,7 @@ app = VersionedFastAPI(
         "url": "https://creativecommons.org/licenses/by/4.0/",
     },
     version=os.getenv("RELEASE_VERSION", "1.0"),
+    lifespan=lifespan,
 )
 
 Instrumentator().instrument(app).expose(app)
@@ -8,16 +8,18 @@ from rdkit.Chem import QED
 from rdkit.Chem import rdMolDescriptors
 from rdkit.Chem import rdmolops
 
-from app.modules.toolkits.cdk_wrapper import cdk_base
 from app.modules.toolkits.cdk_wrapper import get_aromatic_ring_count
+from app.modules.toolkits.cdk_wrapper import get_CDK_descriptor_value
 from app.modules.toolkits.cdk_wrapper import get_CDK_SDG
-from app.modules.toolkits.cdk_wrapper import get_tanimoto_similarity_CDK
+from app.modules.toolkits.cdk_wrapper import get_ring_count
+from app.modules.toolkits.cdk_wrapper import get_tanimoto_similarity_PubChem_CDK_matrix
+from app.modules.toolkits.cdk_wrapper import get_total_exact_mass
+from app.modules.toolkits.cdk_wrapper import get_total_formal_charge
 from app.modules.toolkits.cdk_wrapper import get_vander_waals_volume
-from app.modules.toolkits.cdk_wrapper import JClass
 from app.modules.toolkits.helpers import parse_input
 from app.modules.toolkits.rdkit_wrapper import check_RO5_violations
 from app.modules.toolkits.rdkit_wrapper import get_MolVolume
-from app.modules.toolkits.rdkit_wrapper import get_tanimoto_similarity_rdkit
+from app.modules.toolkits.rdkit_wrapper import get_tanimoto_similarity_rdkit_matrix
 
 
 def get_all_rdkit_descriptors(molecule: any) -> Union[tuple, str]:
@@ -92,101 +94,62 @@ def get_all_cdk_descriptors(molecule: any) -> Union[tuple, str]:
     """
     SDGMol = get_CDK_SDG(molecule)
     if SDGMol:
-        AtomCountDescriptor = (
-            JClass(cdk_base + ".qsar.descriptors.molecular.AtomCountDescriptor")()
-            .calculate(SDGMol)
-            .getValue()
-        )
-        BondCountDescriptor = (
-            JClass(cdk_base + ".qsar.descriptors.molecular.BondCountDescriptor")()
-            .calculate(SDGMol)
-            .getValue()
-        )
+        AtomCountDescriptor = get_CDK_descriptor_value(
+            SDGMol, "AtomCountDescriptor"
+        ).intValue()
+        BondCountDescriptor = get_CDK_descriptor_value(
+            SDGMol, "BondCountDescriptor"
+        ).intValue()
         HeavyAtomsC = SDGMol.getAtomCount()
-        WeightDescriptor = (
-            JClass(cdk_base + ".qsar.descriptors.molecular.WeightDescriptor")()
-            .calculate(SDGMol)
-            .getValue()
-            .toString()
-        )
-        TotalExactMass = JClass(
-            cdk_base + ".tools.manipulator.AtomContainerManipulator",
-        ).getTotalExactMass(SDGMol)
-        ALogP = (
-            JClass(cdk_base + ".qsar.descriptors.molecular.ALOGPDescriptor")()
-            .calculate(SDGMol)
-            .getValue()
-        )
-        NumRotatableBonds = (
-            JClass(
-                cdk_base + ".qsar.descriptors.molecular.RotatableBondsCountDescriptor",
-            )()
-            .calculate(SDGMol)
-            .getValue()
-        )
-        TPSADescriptor = (
-            JClass(cdk_base + ".qsar.descriptors.molecular.TPSADescriptor")()
-            .calculate(SDGMol)
-            .getValue()
-            .toString()
-        )
-        HBondAcceptorCountDescriptor = (
-            JClass(
-                cdk_base + ".qsar.descriptors.molecular.HBondAcceptorCountDescriptor",
-            )()
-            .calculate(SDGMol)
-            .getValue()
-        )
-        HBondDonorCountDescriptor = (
-            JClass(cdk_base + ".qsar.descriptors.molecular.HBondDonorCountDescriptor")()
-            .calculate(SDGMol)
-            .getValue()
-        )
-        RuleOfFiveDescriptor = (
-            JClass(cdk_base + ".qsar.descriptors.molecular.RuleOfFiveDescriptor")()
-            .calculate(SDGMol)
-            .getValue()
-        )
+        WeightDescriptor = get_CDK_descriptor_value(
+            SDGMol, "WeightDescriptor"
+        ).doubleValue()
+        TotalExactMass = get_total_exact_mass(SDGMol)
+        ALogP = get_CDK_descriptor_value(SDGMol, "ALOGPDescriptor").get(0)
+        NumRotatableBonds = get_CDK_descriptor_value(
+            SDGMol, "RotatableBondsCountDescriptor"
+        ).intValue()
+        TPSADescriptor = get_CDK_descriptor_value(
+            SDGMol, "TPSADescriptor"
+        ).doubleValue()
+        HBondAcceptorCountDescriptor = get_CDK_descriptor_value(
+            SDGMol, "HBondAcceptorCountDescriptor"
+        ).intValue()
+        HBondDonorCountDescriptor = get_CDK_descriptor_value(
+            SDGMol, "HBondDonorCountDescriptor"
+        ).intValue()
+        RuleOfFiveDescriptor = get_CDK_descriptor_value(
+            SDGMol, "RuleOfFiveDescriptor"
+        ).intValue()
         AromaticRings = get_aromatic_ring_count(SDGMol)
         QEDWeighted = None
-        FormalCharge = JClass(
-            cdk_base + ".tools.manipulator.AtomContainerManipulator",
-        ).getTotalFormalCharge(SDGMol)
-        FractionalCSP3Descriptor = (
-            JClass(cdk_base + ".qsar.descriptors.molecular.FractionalCSP3Descriptor")()
-            .calculate(SDGMol)
-            .getValue()
-            .toString()
-        )
-        NumRings = (
-            JClass(
-                cdk_base + ".graph.Cycles",
-            )
-            .mcb(SDGMol)
-            .numberOfCycles()
-        )
+        FormalCharge = get_total_formal_charge(SDGMol)
+        FractionalCSP3Descriptor = get_CDK_descriptor_value(
+            SDGMol, "FractionalCSP3Descriptor"
+        ).doubleValue()
+        NumRings = get_ring_count(SDGMol)
         VABCVolume = get_vander_waals_volume(SDGMol)
 
         return (
-            int(str(AtomCountDescriptor)),
-            int(str(BondCountDescriptor)),
+            int(AtomCountDescriptor),
+            int(BondCountDescriptor),
             HeavyAtomsC,
-            float("{:.2f}".format(float(str(WeightDescriptor)))),
-            float("{:.5f}".format(float(str(TotalExactMass)))),
-            float("{:.2f}".format(float(str(ALogP).split(",")[0]))),
-            int(str(NumRotatableBonds)),
-            float("{:.2f}".format(float(str(TPSADescriptor)))),
-            int(str(HBondAcceptorCountDescriptor)),
-            int(str(HBondDonorCountDescriptor)),
-            int(str(HBondAcceptorCountDescriptor)),
-            int(str(HBondDonorCountDescriptor)),
-            int(str(RuleOfFiveDescriptor)),
+            round(WeightDescriptor, 2),
+            round(TotalExactMass, 5),
+            round(ALogP, 2),
+            int(NumRotatableBonds),
+            round(TPSADescriptor, 2),
+            int(HBondAcceptorCountDescriptor),
+            int(HBondDonorCountDescriptor),
+            int(HBondAcceptorCountDescriptor),
+            int(HBondDonorCountDescriptor),
+            int(RuleOfFiveDescriptor),
             AromaticRings,
             str(QEDWeighted),
             FormalCharge,
-            float("{:.2f}".format(float(str(FractionalCSP3Descriptor)))),
+            round(FractionalCSP3Descriptor, 2),
             NumRings,
-            float(str(VABCVolume)),
+            float(VABCVolume),
         )
     else:
         return "Error reading SMILES string, check again."
@@ -300,21 +263,21 @@ def get_tanimoto_similarity(smileslist: str, toolkit: str = "cdk") -> list:
     # Parse comma-separated list of SMILES into a list of SMILES strings
     smiles_list = smileslist.split(",")
 
-    # Create an empty matrix to store similarity scores
-    matrix = [[0.0] * len(smiles_list) for _ in range(len(smiles_list))]
-
-    # Populate the matrix with similarity scores
-    for i in range(len(smiles_list)):
-        for j in range(len(smiles_list)):
-            if toolkit == "rdkit":
-                mol1 = parse_input(smiles_list[i], "rdkit", False)
-                mol2 = parse_input(smiles_list[j], "rdkit", False)
-                matrix[i][j] = get_tanimoto_similarity_rdkit(mol1, mol2)
-            elif toolkit == "cdk":
-                mol1 = parse_input(smiles_list[i], "cdk", False)
-                mol2 = parse_input(smiles_list[j], "cdk", False)
-                matrix[i][j] = get_tanimoto_similarity_CDK(mol1, mol2)
-            else:
-                raise ValueError("Unsupported toolkit:", toolkit)
+    # Parse every distinct SMILES string once and compare the molecules pairwise
+    unique_smiles = list(dict.fromkeys(smiles_list))
+    if toolkit == "rdkit":
+        molecules = [parse_input(smiles, "rdkit", False) for smiles in unique_smiles]
+        matrix = get_tanimoto_similarity_rdkit_matrix(molecules)
+    elif toolkit == "cdk":
+        molecules = [parse_input(smiles, "cdk", False) for smiles in unique_smiles]
+        matrix = get_tanimoto_similarity_PubChem_CDK_matrix(molecules)
+    else:
+        raise ValueError("Unsupported toolkit:", toolkit)
+
+    # Expand the matrix back to the repeated input SMILES
+    if len(unique_smiles) != len(smiles_list):
+        index = {smiles: i for i, smiles in enumerate(unique_smiles)}
+        rows = [index[smiles] for smiles in smiles_list]
+        matrix = [[matrix[i][j] for j in rows] for i in rows]
 
     return get_table(matrix)
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import functools
+import threading
+from collections import OrderedDict
+from typing import Callable
+
+
+def cache_by_smiles(key: Callable, maxsize: int = 8192) -> Callable:
+    """Memoise a wrapper function on the canonical SMILES of its molecule.
+
+    Only use it for functions whose result does not depend on the atom order
+    of the input molecule. On a miss the result is computed from the molecule
+    passed in, exactly as without the cache.
+
+    Args:
+        key (callable): Returns the canonical SMILES of a molecule, e.g. Chem.MolToSmiles for RDKit molecules.
+        maxsize (int): Number of results kept before the least recently used one is evicted.
+
+    Returns:
+        callable: Decorator for functions taking a molecule as first argument.
+    """
+
+    def decorator(function):
+        cache = OrderedDict()
+        lock = threading.Lock()
+
+        @functools.wraps(function)
+        def wrapper(molecule, *args, **kwargs):
+            try:
+                smiles = key(molecule)
+            except Exception:
+                return function(molecule, *args, **kwargs)
+            cache_key = (smiles, args, tuple(sorted(kwargs.items())))
+            try:
+                hash(cache_key)
+            except TypeError:
+                # Unhashable arguments, e.g. a list, aren't cached
+                return function(molecule, *args, **kwargs)
+            with lock:
+                if cache_key in cache:
+                    cache.move_to_end(cache_key)
+                    return cache[cache_key]
+            result = function(molecule, *args, **kwargs)
+            with lock:
+                cache[cache_key] = result
+                if len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return result
+
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
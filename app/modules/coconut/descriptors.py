@@ -1,13 +1,18 @@
 from __future__ import annotations
 
 from typing import Dict
+from typing import List
 from typing import Union
 
+from rdkit import Chem
+
 from app.modules.all_descriptors import get_cdk_rdkit_combined_descriptors
+from app.modules.cache import cache_by_smiles
 from app.modules.npscorer import get_np_score
 from app.modules.toolkits.cdk_wrapper import get_CDK_descriptors
 from app.modules.toolkits.cdk_wrapper import get_CDK_MolecularFormula
 from app.modules.toolkits.cdk_wrapper import get_murko_framework
+from app.modules.toolkits.cdk_wrapper import run_batch
 from app.modules.toolkits.helpers import parse_input
 from app.modules.toolkits.rdkit_wrapper import get_rdkit_descriptors
 from app.modules.tools.sugar_removal import get_sugar_info
@@ -40,6 +45,10 @@ def get_COCONUT_descriptors(smiles: str, toolkit: str) -> Union[Dict[str, float]
 
     SMILES.
 
+    Results are cached on the canonical SMILES, so different spellings of the
+    same molecule share one entry. On a miss they are calculated from the
+    SMILES as given.
+
     Args:
         smiles (str): SMILES input.
         toolkit (str): Toolkit choice ("rdkit" or "cdk").
@@ -48,6 +57,26 @@ def get_COCONUT_descriptors(smiles: str, toolkit: str) -> Union[Dict[str, float]
         dict or str: Dictionary of COCONUT descriptors and their values if successful,
                      or an error message if the toolkit choice is invalid or SMILES is invalid.
     """
+    descriptors = _get_COCONUT_descriptors(smiles, toolkit)
+    # Hand out a copy so callers cannot modify the cached result
+    return dict(descriptors) if isinstance(descriptors, dict) else descriptors
+
+
+def _get_cache_key(smiles: str) -> str:
+    """Return the canonical SMILES the descriptor cache is keyed on."""
+    try:
+        return Chem.CanonSmiles(smiles)
+    except Exception:
+        # Leave inputs RDKit cannot read (e.g. R groups) to the regular parsing
+        return smiles
+
+
+@cache_by_smiles(key=_get_cache_key)
+def _get_COCONUT_descriptors(
+    smiles: str,
+    toolkit: str,
+) -> Union[Dict[str, float], str]:
+    """Calculate COCONUT descriptors for a SMILES, see get_COCONUT_descriptors."""
     if toolkit == "all":
         AllDescriptors = get_cdk_rdkit_combined_descriptors(smiles)
         return AllDescriptors
@@ -104,3 +133,33 @@ def get_COCONUT_descriptors(smiles: str, toolkit: str) -> Union[Dict[str, float]
         if len(DescriptorList) == len(Descriptors)
         else "Error Calculating Descriptors"
     )
+
+
+def get_COCONUT_descriptors_batch(
+    smiles_list: List[str],
+    toolkit: str,
+) -> List[Union[Dict[str, float], str]]:
+    """Calculate COCONUT descriptors for a batch of SMILES.
+
+    The SMILES are processed on the JVM attached worker threads. Only the
+    CDK calls run in parallel, the RDKit parts hold the GIL and still run
+    one at a time. Each distinct molecule is only calculated once.
+
+    Args:
+        smiles_list (List[str]): SMILES inputs.
+        toolkit (str): Toolkit choice ("rdkit" or "cdk").
+
+    Returns:
+        list: COCONUT descriptors for each SMILES in the order of the input.
+    """
+    unique_smiles = list(dict.fromkeys(smiles_list))
+    results = dict(
+        zip(
+            unique_smiles,
+            run_batch(_get_COCONUT_descriptors, unique_smiles, toolkit),
+        ),
+    )
+    return [
+        dict(results[smiles]) if isinstance(results[smiles], dict) else results[smiles]
+        for smiles in smiles_list
+    ]
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from chembl_structure_pipeline import checker
-from chembl_structure_pipeline import standardizer
 from rdkit import Chem
 
 import app.modules.toolkits.cdk_wrapper as cdk
@@ -52,6 +50,8 @@ def get_parent_smiles(molecule: Chem.Mol) -> str:
     """
 
     if molecule:
+        from chembl_structure_pipeline import standardizer
+
         mol_block = Chem.MolToMolBlock(molecule)
         standarized = standardizer.standardize_molblock(mol_block)
         parent, _ = standardizer.get_parent_molblock(standarized)
@@ -162,7 +162,7 @@ def get_representations(molecule: Chem.Mol) -> dict:
     """
     if molecule:
         InChI = Chem.inchi.MolToInchi(molecule)
-        InChI_Key = Chem.inchi.MolToInchiKey(molecule)
+        InChI_Key = Chem.inchi.InchiToInchiKey(InChI)
         cdkMolecule = parse_input(Chem.MolToSmiles(molecule), "cdk", False)
         Murko = cdk.get_murko_framework(cdkMolecule)
         return {
@@ -190,6 +190,9 @@ def get_COCONUT_preprocessing(
     Raises:
         InvalidInputException: If the input SMILES string is invalid.
     """
+    from chembl_structure_pipeline import checker
+    from chembl_structure_pipeline import standardizer
+
     try:
         # Preprocess input text
         input_text = input_text.replace(" ", "+").replace("\\\\", "\\")
@@ -1,12 +1,52 @@
 from __future__ import annotations
 
+import contextlib
 import os
+import threading
+
+# DECIMER runs on the GPU when CUDA_VISIBLE_DEVICES names a device.
+USE_GPU = os.getenv("CUDA_VISIBLE_DEVICES", "") not in ("", "-1")
+
+# TensorFlow starts an intra-op thread per core in every uvicorn worker, so
+# concurrent OCSR requests in several workers oversubscribe the CPUs. The
+# cores are shared between the workers, unless set in the environment. This
+# has to happen before DECIMER imports TensorFlow, and isn't needed when the
+# model runs on the GPU.
+if not USE_GPU:
+    os.environ.setdefault(
+        "TF_NUM_INTRAOP_THREADS",
+        str(max(1, (os.cpu_count() or 1) // int(os.getenv("WORKERS", "1")))),
+    )
+    os.environ.setdefault("TF_NUM_INTEROP_THREADS", "2")
+
+import tensorflow as tf
+
+if USE_GPU:
+    # TensorFlow reserves all GPU memory for the first uvicorn worker unless
+    # it may grow, this has to be set before DECIMER loads its models.
+    for gpu in tf.config.list_physical_devices("GPU"):
+        tf.config.experimental.set_memory_growth(gpu, True)
 
 import cv2
 from DECIMER import predict_SMILES
 from decimer_segmentation import segment_chemical_structures_from_file
 from PIL import Image
 
+# On the GPU, concurrent requests queue for the device instead of competing
+# for its memory.
+_predict_slot = (
+    threading.BoundedSemaphore(int(os.getenv("OCSR_GPU_CONCURRENCY", "1")))
+    if USE_GPU
+    else contextlib.nullcontext()
+)
+
+
+@contextlib.contextmanager
+def _predict_device():
+    """Wait for a prediction slot and place the prediction on the device."""
+    with _predict_slot, tf.device("/GPU:0" if USE_GPU else "/CPU:0"):
+        yield
+
 
 def convert_image(path: str) -> str:
     """Convert a GIF image to PNG format, resize, and place on a white.
@@ -93,14 +133,16 @@ def get_predicted_segments(path: str) -> str:
     image_name, segments = get_segments(path)
 
     if len(segments) == 0:
-        smiles = predict_SMILES(path)
+        with _predict_device():
+            smiles = predict_SMILES(path)
         return smiles
     else:
         for segment_index in range(len(segments)):
             segmentname = f"{image_name[:-5]}_{segment_index}.png"
             segment_path = os.path.join(segmentname)
             cv2.imwrite(segment_path, segments[segment_index])
-            smiles = predict_SMILES(segment_path)
+            with _predict_device():
+                smiles = predict_SMILES(segment_path)
             smiles_predicted.append(smiles)
             os.remove(segment_path)
         return ".".join(smiles_predicted)
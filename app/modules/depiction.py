@@ -1,14 +1,46 @@
 from __future__ import annotations
 
-import xml.etree.ElementTree as ET
+import math
 
 from jpype import JClass
 from rdkit import Chem
 from rdkit.Chem import rdDepictor
 from rdkit.Chem.Draw import rdMolDraw2D
 
+from app.modules.toolkits.cdk_wrapper import cdk_base
 from app.modules.toolkits.cdk_wrapper import get_CDK_SDG
 from app.modules.toolkits.cdk_wrapper import get_cip_annotation
+from app.modules.toolkits.cdk_wrapper import lazy_jclass
+from app.modules.toolkits.cdk_wrapper import LazyJavaObject
+from app.modules.toolkits.cdk_wrapper import run_batch
+
+# DepictionGenerator is immutable, so the base generators are configured once
+# and only the per-call size and highlight are applied on top of them.
+_StandardGenerator = lazy_jclass(
+    cdk_base + ".renderer.generators.standard.StandardGenerator"
+)
+_Color = lazy_jclass("java.awt.Color")
+_Kekulization = lazy_jclass(cdk_base + ".aromaticity.Kekulization")
+_SmartsPattern = lazy_jclass(cdk_base + ".smarts.SmartsPattern")
+_GeometryTools = lazy_jclass(cdk_base + ".geometry.GeometryTools")
+_SilentChemObjectBuilder = lazy_jclass(cdk_base + ".silent.SilentChemObjectBuilder")
+
+_unicolor_depiction_generator = LazyJavaObject(
+    lambda: JClass(cdk_base + ".depict.DepictionGenerator")()
+    .withParam(_StandardGenerator.StrokeRatio.class_, 1.0)
+    .withAnnotationColor(_Color.BLACK)
+    .withParam(
+        _StandardGenerator.AtomColor.class_,
+        JClass(cdk_base + ".renderer.color.UniColor")(_Color.BLACK),
+    )
+    .withBackgroundColor(_Color.WHITE),
+)
+_color_depiction_generator = LazyJavaObject(
+    lambda: JClass(cdk_base + ".depict.DepictionGenerator")()
+    .withAtomColors(JClass(cdk_base + ".renderer.color.CDK2DAtomColors")())
+    .withParam(_StandardGenerator.StrokeRatio.class_, 1.0)
+    .withBackgroundColor(_Color.WHITE),
+)
 
 
 def get_cdk_depiction(
@@ -30,38 +62,14 @@ def get_cdk_depiction(
     Returns:
         image (SVG): CDK Structure Depiction as an SVG image.
     """
-    print(unicolor)
-
-    cdk_base = "org.openscience.cdk"
-    StandardGenerator = JClass(
-        cdk_base + ".renderer.generators.standard.StandardGenerator",
-    )
-    Color = JClass("java.awt.Color")
-    UniColor = JClass(cdk_base + ".renderer.color.UniColor")
-    CDK2DAtomColors = JClass(cdk_base + ".renderer.color.CDK2DAtomColors")()
-    Kekulization = JClass(cdk_base + ".aromaticity.Kekulization")
-    SmartsPattern = JClass(cdk_base + ".smarts.SmartsPattern")
-    SCOB = JClass(cdk_base + ".silent.SilentChemObjectBuilder")
-
     if unicolor:
-        DepictionGenerator = (
-            JClass(cdk_base + ".depict.DepictionGenerator")()
-            .withSize(molSize[0], molSize[1])
-            .withParam(StandardGenerator.StrokeRatio.class_, 1.0)
-            .withAnnotationColor(Color.BLACK)
-            .withParam(StandardGenerator.AtomColor.class_, UniColor(Color.BLACK))
-            .withBackgroundColor(Color.WHITE)
-            .withFillToFit()
-        )
+        DepictionGenerator = _unicolor_depiction_generator
     else:
-        DepictionGenerator = (
-            JClass(cdk_base + ".depict.DepictionGenerator")()
-            .withAtomColors(CDK2DAtomColors)
-            .withSize(molSize[0], molSize[1])
-            .withParam(StandardGenerator.StrokeRatio.class_, 1.0)
-            .withFillToFit()
-            .withBackgroundColor(Color.WHITE)
-        )
+        DepictionGenerator = _color_depiction_generator
+    DepictionGenerator = DepictionGenerator.withSize(
+        molSize[0],
+        molSize[1],
+    ).withFillToFit()
 
     if CIP:
         SDGMol = get_cip_annotation(molecule)
@@ -72,46 +80,65 @@ def get_cdk_depiction(
         # Rotate molecule
         if kekulize:
             try:
-                Kekulization.kekulize(SDGMol)
+                _Kekulization.kekulize(SDGMol)
             except Exception as e:
                 print(e + "Can't Kekulize molecule")
 
-        point = JClass(
-            cdk_base + ".geometry.GeometryTools",
-        ).get2DCenter(SDGMol)
-        JClass(cdk_base + ".geometry.GeometryTools").rotate(
-            SDGMol,
-            point,
-            (rotate * JClass("java.lang.Math").PI / 180.0),
-        )
+        point = _GeometryTools.get2DCenter(SDGMol)
+        _GeometryTools.rotate(SDGMol, point, math.radians(rotate))
 
         if highlight and highlight.strip():
-            tmpPattern = SmartsPattern.create(highlight, SCOB.getInstance())
-            SmartsPattern.prepare(SDGMol)
+            tmpPattern = _SmartsPattern.create(
+                highlight,
+                _SilentChemObjectBuilder.getInstance(),
+            )
+            _SmartsPattern.prepare(SDGMol)
             tmpMappings = tmpPattern.matchAll(SDGMol)
             tmpSubstructures = tmpMappings.toSubstructures()
-            lightBlue = Color(173, 216, 230)
             DepictionGenerator = DepictionGenerator.withHighlight(
-                tmpSubstructures, lightBlue
+                tmpSubstructures, _Color(173, 216, 230)
             ).withOuterGlowHighlight()
 
-        mol_imageSVG = (
-            DepictionGenerator.depict(
-                SDGMol,
-            )
-            .toSvgStr("px")
-            .getBytes()
-        )
-        encoded_image = ET.tostring(
-            ET.fromstring(mol_imageSVG),
-            encoding="unicode",
-        )
-
-        return encoded_image
+        mol_imageSVG = str(DepictionGenerator.depict(SDGMol).toSvgStr("px"))
+        # Width and height are already set by withSize, only the XML
+        # declaration in front of the root element has to go.
+        svg_start = mol_imageSVG.find("<svg")
+        if svg_start == -1:
+            return mol_imageSVG
+        return mol_imageSVG[svg_start:]
     else:
         return "Error reading SMILES string, check again."
 
 
+def get_cdk_depiction_batch(
+    molecules: list,
+    molSize=(512, 512),
+    rotate=0,
+    kekulize=True,
+    CIP=True,
+    unicolor=False,
+    highlight="",
+) -> list:
+    """Depict a batch of molecules using the CDK Depiction Generator.
+
+    Args:
+        molecules (list): CDK IAtomContainers parsed from the SMILES strings given by the user.
+
+    Returns:
+        list: CDK Structure Depictions as SVG images in the order of the input molecules.
+    """
+    return run_batch(
+        get_cdk_depiction,
+        molecules,
+        molSize,
+        rotate,
+        kekulize,
+        CIP,
+        unicolor,
+        highlight,
+    )
+
+
 def get_rdkit_depiction(
     molecule: Chem.Mol,
     mol_size=(512, 512),
@@ -135,15 +162,16 @@ def get_rdkit_depiction(
 
     Returns:
         str: RDKit Structure Depiction as an SVG image.
+
+    Note:
+        The molecule is kekulized and given 2D coordinates in place.
     """
 
-    mc = Chem.Mol(molecule.ToBinary())
+    mc = molecule
 
     if kekulize:
-        try:
-            Chem.Kekulize(mc)
-        except Chem.KekulizeException:
-            mc = Chem.Mol(molecule.ToBinary())
+        # Leaves the molecule untouched if it cannot be kekulized
+        Chem.KekulizeIfPossible(mc)
 
     if not mc.GetNumConformers():
         rdDepictor.Compute2DCoords(mc)
@@ -151,29 +179,63 @@ def get_rdkit_depiction(
     if CIP:
         Chem.AssignStereochemistry(mc, force=True, cleanIt=True)
 
+    # Prepare the molecule once here instead of letting the drawer copy and
+    # prepare it again.
+    prepared = rdMolDraw2D.PrepareMolForDrawing(mc)
+
     drawer = rdMolDraw2D.MolDraw2DSVG(mol_size[0], mol_size[1])
-    drawer.drawOptions().rotate = rotate
-    drawer.drawOptions().addStereoAnnotation = CIP
+    drawOptions = drawer.drawOptions()
+    drawOptions.prepareMolsBeforeDrawing = False
+    drawOptions.rotate = rotate
+    drawOptions.addStereoAnnotation = CIP
 
     if unicolor:
-        drawer.drawOptions().useBWAtomPalette()
-
-    if highlight:
-        patt = Chem.MolFromSmarts(highlight)
-        if patt:
-            hit_ats = mc.GetSubstructMatch(patt)
-            hit_bonds = [
-                mc.GetBondBetweenAtoms(at1, at2).GetIdx()
-                for at1, at2 in zip(hit_ats[:-1], hit_ats[1:])
-            ]
-            rdMolDraw2D.PrepareAndDrawMolecule(
-                drawer, mc, highlightAtoms=hit_ats, highlightBonds=hit_bonds
-            )
-        else:
-            drawer.DrawMolecule(mc)
+        drawOptions.useBWAtomPalette()
+
+    patt = Chem.MolFromSmarts(highlight) if highlight else None
+    if patt:
+        hit_ats = mc.GetSubstructMatch(patt)
+        hit_bonds = [
+            mc.GetBondBetweenAtoms(at1, at2).GetIdx()
+            for at1, at2 in zip(hit_ats[:-1], hit_ats[1:])
+        ]
+        drawer.DrawMolecule(
+            prepared,
+            highlightAtoms=hit_ats,
+            highlightBonds=hit_bonds,
+        )
     else:
-        drawer.DrawMolecule(mc)
+        drawer.DrawMolecule(prepared)
 
     drawer.FinishDrawing()
     svg = drawer.GetDrawingText()
-    return svg.replace("svg:", "")
+    # Current RDKit releases no longer emit the svg: namespace prefix
+    if "svg:" in svg:
+        svg = svg.replace("svg:", "")
+    return svg
+
+
+def get_rdkit_depiction_batch(
+    molecules: list,
+    mol_size=(512, 512),
+    rotate=0,
+    kekulize=True,
+    CIP=False,
+    unicolor=False,
+    highlight: str = "",
+) -> list:
+    """
+    Generate 2D depictions for a batch of molecules using RDKit.
+
+    Args:
+        molecules (list): RDKit molecule objects.
+
+    Returns:
+        list: RDKit Structure Depictions as SVG images in the order of the input molecules.
+    """
+    return [
+        get_rdkit_depiction(
+            molecule, mol_size, rotate, kekulize, CIP, unicolor, highlight
+        )
+        for molecule in molecules
+    ]
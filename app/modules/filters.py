@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import functools
+from typing import Optional
+from typing import Tuple
+
+from rdkit import Chem
+from rdkit.Chem import QED
+
+from app.exception_handlers import InvalidInputException
+from app.modules.cache import cache_by_smiles
+from app.modules.npscorer import get_np_score
+from app.modules.toolkits.helpers import parse_input
+from app.modules.toolkits.rdkit_wrapper import check_RO5_violations
+from app.modules.toolkits.rdkit_wrapper import get_filter_descriptors
+from app.modules.toolkits.rdkit_wrapper import get_GhoseFilter
+from app.modules.toolkits.rdkit_wrapper import get_PAINS
+from app.modules.toolkits.rdkit_wrapper import get_REOSFilter
+from app.modules.toolkits.rdkit_wrapper import get_RuleofThree
+from app.modules.toolkits.rdkit_wrapper import get_sas_score
+from app.modules.toolkits.rdkit_wrapper import get_VeberFilter
+
+# Number of SMILES evaluated per task, large enough to amortize sending the
+# batch to a worker process and its results back.
+FILTER_BATCH_SIZE = 64
+
+
+@functools.lru_cache(maxsize=16384)
+def _parse_filter_input(smiles: str) -> Chem.Mol:
+    """Parse a SMILES string and store its canonical SMILES on the molecule.
+
+    The canonical SMILES is written once per input and used as the cache key
+    of the scores below, instead of every score cache writing it again.
+    """
+    mol = parse_input(smiles, "rdkit", False)
+    if mol:
+        mol.SetProp("_filter_cache_key", Chem.MolToSmiles(mol))
+    return mol
+
+
+def _get_filter_cache_key(molecule: Chem.Mol) -> str:
+    return molecule.GetProp("_filter_cache_key")
+
+
+# The QED, SA and NP scores are the expensive part of the filters, they are
+# cached on the canonical SMILES so that repeated molecules are scored once.
+_get_qed = cache_by_smiles(key=_get_filter_cache_key)(QED.qed)
+_get_sas_score = cache_by_smiles(key=_get_filter_cache_key)(get_sas_score.__wrapped__)
+_get_np_score = cache_by_smiles(key=_get_filter_cache_key)(get_np_score.__wrapped__)
+
+# Order in which the filters are evaluated when short-circuiting, cheapest
+# first. The descriptor based filters share one descriptor calculation, the
+# PAINS substructure search and QED (which runs its own substructure alerts)
+# are the most expensive.
+_FILTER_COST_ORDER = (
+    "lipinski",
+    "veber",
+    "reos",
+    "ghose",
+    "ruleofthree",
+    "nplikeness",
+    "sascore",
+    "pains",
+    "qedscore",
+)
+
+
+def parse_range(name: str, value: str) -> Optional[Tuple[float, float]]:
+    """Parse a score range given as start-end, e.g. 0-10.
+
+    Args:
+        name (str): Name of the parameter, used in the error message.
+        value (str): The range string.
+
+    Returns:
+        Tuple[float, float]: Start and end of the range, or None if the value isn't a range.
+
+    Raises:
+        InvalidInputException: If the start or end is not a number.
+    """
+    parts = value.split("-")
+    if len(parts) != 2:
+        return None
+    try:
+        return float(parts[0]), float(parts[1])
+    except ValueError:
+        raise InvalidInputException(name=name, value=value)
+
+
+def get_filter_results(
+    smiles: str,
+    pains: bool = True,
+    lipinski: bool = True,
+    veber: bool = True,
+    reos: bool = True,
+    ghose: bool = True,
+    ruleofthree: bool = True,
+    qedscore: Optional[Tuple[float, float]] = (0, 10),
+    sascore: Optional[Tuple[float, float]] = (0, 10),
+    nplikeness: Optional[Tuple[float, float]] = (0, 10),
+    short_circuit: bool = False,
+) -> str:
+    """Apply the selected filters to a molecule.
+
+    Args:
+        smiles (str): SMILES string of the molecule.
+        pains, lipinski, veber, reos, ghose, ruleofthree (bool): Whether to apply the respective filter.
+        qedscore, sascore, nplikeness (Tuple[float, float]): Accepted score range as parsed by parse_range, the filter is skipped if it is None.
+        short_circuit (bool): Evaluate the filters cheapest first and stop at the first one the molecule fails (a PAINS match counts as failing). Defaults to False.
+
+    Returns:
+        str: The SMILES followed by T or F for each applied filter, or None if the SMILES could not be parsed or, when short-circuiting, the molecule failed a filter.
+    """
+    mol = _parse_filter_input(smiles)
+    if not mol:
+        return None
+    # The cached molecule may be in use by another thread
+    mol = Chem.Mol(mol)
+
+    if lipinski or veber or reos or ghose or ruleofthree:
+        descriptors = get_filter_descriptors(mol)
+
+    # The selected filters in the order of the output columns
+    filters = {}
+    if pains:
+        filters["pains"] = lambda: "family" in str(get_PAINS(mol))
+    if lipinski:
+        filters["lipinski"] = lambda: check_RO5_violations(mol, descriptors) == 0
+    if veber:
+        filters["veber"] = lambda: get_VeberFilter(mol, descriptors)
+    if reos:
+        filters["reos"] = lambda: get_REOSFilter(mol, descriptors)
+    if ghose:
+        filters["ghose"] = lambda: get_GhoseFilter(mol, descriptors)
+    if ruleofthree:
+        filters["ruleofthree"] = lambda: get_RuleofThree(mol, descriptors)
+    if qedscore is not None:
+        filters["qedscore"] = lambda: qedscore[0] <= _get_qed(mol) <= qedscore[1]
+    if sascore is not None:
+        filters["sascore"] = lambda: sascore[0] <= _get_sas_score(mol) <= sascore[1]
+    if nplikeness is not None:
+        filters["nplikeness"] = (
+            lambda: nplikeness[0] <= float(_get_np_score(mol)) <= nplikeness[1]
+        )
+
+    results = {}
+    for name in _FILTER_COST_ORDER if short_circuit else filters:
+        if name not in filters:
+            continue
+        results[name] = filters[name]()
+        if short_circuit and results[name] == (name == "pains"):
+            return None
+
+    if not results:
+        return smiles + ":"
+    return (
+        smiles + " :  " + ", ".join(["T" if results[name] else "F" for name in filters])
+    )
+
+
+def get_filter_results_batch(smiles: list, *args) -> list:
+    """Apply the selected filters to a batch of molecules.
+
+    This is the unit of work sent to a worker process, so that the
+    molecules are parsed in the worker and only strings are transferred.
+
+    Args:
+        smiles (list): SMILES strings of the molecules.
+        *args: The filter selection passed on to get_filter_results.
+
+    Returns:
+        list: The results of get_filter_results in the order of the input molecules.
+    """
+    return [get_filter_results(item, *args) for item in smiles]
@@ -6,7 +6,10 @@ import os
 import pickle
 
 import pystow
-from rdkit.Chem import rdMolDescriptors
+from rdkit import Chem
+from rdkit.Chem import rdFingerprintGenerator
+
+from app.modules.cache import cache_by_smiles
 
 # Set path
 default_path = pystow.join("NP_model")
@@ -21,6 +24,9 @@ if not os.path.exists(model_path):
 
 fscore = pickle.load(gzip.open(model_path))
 
+# Morgan radius 2 count fingerprint the model was trained on
+morgan_generator = rdFingerprintGenerator.GetMorganGenerator(radius=2)
+
 
 def get_np_model(model_path) -> dict:
     """Load the NP model from a pickle file.
@@ -48,7 +54,7 @@ def score_mol_with_confidence(molecule) -> dict:
     """
     if molecule is None:
         raise ValueError("Invalid molecule")
-    fp = rdMolDescriptors.GetMorganFingerprint(molecule, 2)
+    fp = morgan_generator.GetSparseCountFingerprint(molecule)
     bits = fp.GetNonzeroElements()
 
     # Calculating the score
@@ -84,6 +90,7 @@ def score_mol(molecule) -> float:
     return score
 
 
+@cache_by_smiles(key=Chem.MolToSmiles)
 def get_np_score(molecule: any) -> str:
     """Convert SMILES string to RDKit molecule object and generate the NP.
 
@@ -1,32 +1,48 @@
 from __future__ import annotations
 
+import asyncio
+import functools
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 from typing import Union
 
+import numpy as np
 import pystow
 from jpype import getDefaultJVMPath
 from jpype import isJVMStarted
 from jpype import JClass
-from jpype import JPackage
 from jpype import JVMNotFoundException
 from jpype import startJVM
 
+from app.modules.cache import cache_by_smiles
+
+_jvm_lock = threading.Lock()
+
 
 def setup_jvm():
-    try:
-        jvmPath = getDefaultJVMPath()
-    except JVMNotFoundException:
-        print("If you see this message, for some reason JPype cannot find jvm.dll.")
-        print(
-            "This indicates that the environment variable JAVA_HOME is not set properly."
-        )
-        print("You can set it or set it manually in the code")
-        jvmPath = "Define/path/or/set/JAVA_HOME/variable/properly"
+    """Start the JVM with the CDK, OPSIN, centres and SugarRemoval jars.
+
+    Missing jars are downloaded first. Safe to call repeatedly and from
+    several threads, only the first call starts the JVM.
+    """
+    with _jvm_lock:
+        if isJVMStarted():
+            return
+
+        try:
+            jvmPath = getDefaultJVMPath()
+        except JVMNotFoundException:
+            print("If you see this message, for some reason JPype cannot find jvm.dll.")
+            print(
+                "This indicates that the environment variable JAVA_HOME is not set properly."
+            )
+            print("You can set it or set it manually in the code")
+            jvmPath = "Define/path/or/set/JAVA_HOME/variable/properly"
 
-    print(jvmPath)
+        print(jvmPath)
 
-    if not isJVMStarted():
         paths = {
             "cdk-2.10": "https://github.com/cdk/cdk/releases/download/cdk-2.10/cdk-2.10.jar",
             "SugarRemovalUtility-jar-with-dependencies": "https://github.com/JonasSchaub/SugarRemoval/releases/download/v1.3.2/SugarRemovalUtility-jar-with-dependencies.jar",
@@ -44,11 +60,230 @@ def setup_jvm():
         startJVM("-ea", "-Xmx4096M", classpath=[jar_paths[key] for key in jar_paths])
 
 
-setup_jvm()
+class LazyJavaObject:
+    """Java class or object that is only created on first use.
+
+    Resolving it starts the JVM if necessary, so importing the toolkit
+    modules does not download jars or start the JVM. Attribute access, calls
+    and isinstance checks are forwarded to the resolved object. Pass
+    resolve() when the object itself is needed as a Java argument.
+    """
+
+    __slots__ = ("_factory", "_value")
+
+    def __init__(self, factory):
+        self._factory = factory
+        self._value = None
+
+    def resolve(self):
+        if self._value is None:
+            setup_jvm()
+            self._value = self._factory()
+        return self._value
+
+    def __getattr__(self, name: str):
+        return getattr(self.resolve(), name)
+
+    def __call__(self, *args, **kwargs):
+        return self.resolve()(*args, **kwargs)
+
+    def __instancecheck__(self, instance) -> bool:
+        return isinstance(instance, self.resolve())
+
+
+def lazy_jclass(name: str) -> LazyJavaObject:
+    """Look up a Java class by its fully qualified name on first use.
+
+    Args:
+        name (str): Fully qualified Java class name.
+
+    Returns:
+        LazyJavaObject: The Java class, resolved when first used.
+    """
+    return LazyJavaObject(lambda: JClass(name))
+
+
+def _lazy_instance(name: str) -> LazyJavaObject:
+    """Create an instance of a Java class lazily, with its default constructor.
+
+    Args:
+        name (str): Fully qualified Java class name.
+
+    Returns:
+        LazyJavaObject: The Java object, created when first used.
+    """
+    return LazyJavaObject(lambda: JClass(name)())
+
+
 cdk_base = "org.openscience.cdk"
-opsin_base = JPackage("uk").ac.cam.ch.wwmm.opsin
-_nametostruct = opsin_base.NameToStructure.getInstance()
-_restoinchi = opsin_base.NameToInchi.convertResultToInChI
+_opsin_base = "uk.ac.cam.ch.wwmm.opsin"
+_nametostruct = LazyJavaObject(
+    lambda: JClass(_opsin_base + ".NameToStructure").getInstance(),
+)
+_restoinchi = LazyJavaObject(
+    lambda: JClass(_opsin_base + ".NameToInchi").convertResultToInChI,
+)
+
+# CDK classes and stateless helpers are resolved once on first use rather
+# than through JClass on every call.
+_SilentChemObjectBuilder = lazy_jclass(cdk_base + ".silent.SilentChemObjectBuilder")
+_SmilesParser = lazy_jclass(cdk_base + ".smiles.SmilesParser")
+_StructureDiagramGenerator = lazy_jclass(cdk_base + ".layout.StructureDiagramGenerator")
+_StringWriter = lazy_jclass("java.io.StringWriter")
+_SDFWriter = lazy_jclass(cdk_base + ".io.SDFWriter")
+_MurckoFragmenter = lazy_jclass(cdk_base + ".fragment.MurckoFragmenter")
+_Cycles = lazy_jclass(cdk_base + ".graph.Cycles")
+_ElectronDonation = lazy_jclass(cdk_base + ".aromaticity.ElectronDonation")
+_Aromaticity = lazy_jclass(cdk_base + ".aromaticity.Aromaticity")
+_aromaticity_daylight = LazyJavaObject(
+    lambda: _Aromaticity(_ElectronDonation.daylight(), _Cycles.cdkAromaticSet()),
+)
+_aromaticity_cdk = LazyJavaObject(
+    lambda: _Aromaticity(_ElectronDonation.cdk(), _Cycles.cdkAromaticSet()),
+)
+_AtomContainerManipulator = lazy_jclass(
+    cdk_base + ".tools.manipulator.AtomContainerManipulator",
+)
+_RingManipulator = lazy_jclass(cdk_base + ".tools.manipulator.RingManipulator")
+_MolecularFormulaManipulator = lazy_jclass(
+    cdk_base + ".tools.manipulator.MolecularFormulaManipulator",
+)
+_vabc_volume = _lazy_instance(cdk_base + ".geometry.volume.VABCVolume")
+_Tanimoto = lazy_jclass(cdk_base + ".similarity.Tanimoto")
+_PubchemFingerprinter = lazy_jclass(cdk_base + ".fingerprint.PubchemFingerprinter")
+_CircularFingerprinter = lazy_jclass(cdk_base + ".fingerprint.CircularFingerprinter")
+_hydrogen_adder = LazyJavaObject(
+    lambda: JClass(cdk_base + ".tools.CDKHydrogenAdder").getInstance(
+        _SilentChemObjectBuilder.getInstance(),
+    ),
+)
+_SmiFlavor = lazy_jclass(cdk_base + ".smiles.SmiFlavor")
+_SmilesGenerator = lazy_jclass(cdk_base + ".smiles.SmilesGenerator")
+_absolute_smiles_generator = LazyJavaObject(
+    lambda: _SmilesGenerator(_SmiFlavor.Absolute),
+)
+_cxsmiles_generator = LazyJavaObject(
+    lambda: _SmilesGenerator(_SmiFlavor.Absolute | _SmiFlavor.CxSmilesWithCoords),
+)
+_InChIGeneratorFactory = lazy_jclass(cdk_base + ".inchi.InChIGeneratorFactory")
+_HOSECodeGenerator = lazy_jclass(cdk_base + ".tools.HOSECodeGenerator")
+
+_IBond = lazy_jclass(cdk_base + ".interfaces.IBond")
+_IStereoElement = lazy_jclass(cdk_base + ".interfaces.IStereoElement")
+_Stereocenters = lazy_jclass(cdk_base + ".stereo.Stereocenters")
+_StandardGenerator = lazy_jclass(
+    cdk_base + ".renderer.generators.standard.StandardGenerator",
+)
+_centres_base = "com.simolecule.centres"
+_BaseMol = lazy_jclass(_centres_base + ".BaseMol")
+_CdkLabeller = lazy_jclass(_centres_base + ".CdkLabeller")
+_Descriptor = lazy_jclass(_centres_base + ".Descriptor")
+
+_descriptors_base = cdk_base + ".qsar.descriptors.molecular"
+_ALOGPDescriptor = lazy_jclass(_descriptors_base + ".ALOGPDescriptor")
+_molecular_descriptors = {
+    name: _lazy_instance(_descriptors_base + "." + name)
+    for name in (
+        "AtomCountDescriptor",
+        "BondCountDescriptor",
+        "WeightDescriptor",
+        "RotatableBondsCountDescriptor",
+        "TPSADescriptor",
+        "HBondAcceptorCountDescriptor",
+        "HBondDonorCountDescriptor",
+        "RuleOfFiveDescriptor",
+        "FractionalCSP3Descriptor",
+    )
+}
+
+
+# SmilesParser, StructureDiagramGenerator, PubchemFingerprinter and
+# ALOGPDescriptor keep state between calls, so every thread gets its own
+# instance and reuses it.
+_local = threading.local()
+
+
+def _thread_local(name: str, factory):
+    """Return the calling thread's instance of a CDK helper.
+
+    Args:
+        name (str): Attribute name the instance is stored under.
+        factory (callable): Creates the instance on first use in a thread.
+
+    Returns:
+        The helper instance owned by the current thread.
+    """
+    instance = getattr(_local, name, None)
+    if instance is None:
+        instance = factory()
+        setattr(_local, name, instance)
+    return instance
+
+
+def _attach_thread_to_jvm() -> None:
+    """Attach a batch worker thread to the JVM once, as a daemon thread."""
+    setup_jvm()
+    thread = JClass("java.lang.Thread")
+    if not thread.isAttached():
+        thread.attachAsDaemon()
+
+
+# JPype releases the GIL while Java code runs, so CDK work on a batch scales
+# across these worker threads.
+_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count(),
+    initializer=_attach_thread_to_jvm,
+)
+
+
+# PubChem fingerprints have 881 bits, stored as 14 64 bit words.
+_PUBCHEM_FINGERPRINT_WORDS = 14
+_POPCOUNT_TABLE = np.array(
+    [bin(byte).count("1") for byte in range(256)], dtype=np.uint8
+)
+
+# Molecules with more atoms than this have their HOSECodes generated in
+# parallel blocks of this size.
+_HOSE_ATOMS_PER_TASK = 16
+
+
+def run_batch(function, molecules: List[any], *args) -> list:
+    """Apply a wrapper function to every molecule of a batch.
+
+    The molecules are processed concurrently on JVM attached worker threads.
+
+    Args:
+        function (callable): Single molecule wrapper function.
+        molecules (List[IAtomContainer]): molecules given by the user.
+        *args: Additional positional arguments passed to the function.
+
+    Returns:
+        list: Results in the order of the input molecules.
+    """
+    return list(_executor.map(lambda molecule: function(molecule, *args), molecules))
+
+
+def get_chem_object_builder():
+    """Return the SilentChemObjectBuilder instance.
+
+    Returns:
+        IChemObjectBuilder: The builder used for the CDK molecules of this service.
+    """
+    return _SilentChemObjectBuilder.getInstance()
+
+
+def get_absolute_SMILES(molecule: any) -> str:
+    """Generate the absolute SMILES of a molecule as given, without a layout.
+
+    The CDK results are cached on it.
+
+    Args:
+        molecule (IAtomContainer): molecule given by the user.
+
+    Returns:
+        str: Absolute SMILES, including stereo and isotopes.
+    """
+    return str(_absolute_smiles_generator.create(molecule))
 
 
 def get_CDK_IAtomContainer(smiles: str):
@@ -60,11 +295,10 @@ def get_CDK_IAtomContainer(smiles: str):
     Returns:
         mol (object): IAtomContainer with CDK.
     """
-    SCOB = JClass(cdk_base + ".silent.SilentChemObjectBuilder")
-    SmilesParser = JClass(
-        cdk_base + ".smiles.SmilesParser",
-    )(SCOB.getInstance())
-    molecule = SmilesParser.parseSmiles(smiles)
+    smiles_parser = _thread_local(
+        "smiles_parser", lambda: _SmilesParser(_SilentChemObjectBuilder.getInstance())
+    )
+    molecule = smiles_parser.parseSmiles(smiles)
     return molecule
 
 
@@ -79,9 +313,10 @@ def get_CDK_SDG(molecule: any):
     Returns:
         mol object: mol object with CDK SDG.
     """
-    StructureDiagramGenerator = JClass(
-        cdk_base + ".layout.StructureDiagramGenerator",
-    )()
+    StructureDiagramGenerator = _thread_local(
+        "structure_diagram_generator",
+        _StructureDiagramGenerator,
+    )
     StructureDiagramGenerator.generateCoordinates(molecule)
     molecule_ = StructureDiagramGenerator.getMolecule()
 
@@ -100,9 +335,9 @@ def get_CDK_SDG_mol(molecule: any, V3000=False) -> str:
     Returns:
         str: CDK Structure Diagram Layout mol block.
     """
-    StringW = JClass("java.io.StringWriter")()
+    StringW = _StringWriter()
     moleculeSDG = get_CDK_SDG(molecule)
-    SDFW = JClass(cdk_base + ".io.SDFWriter")(StringW)
+    SDFW = _SDFWriter(StringW)
     SDFW.setAlwaysV3000(V3000)
     SDFW.write(moleculeSDG)
     SDFW.flush()
@@ -110,6 +345,7 @@ def get_CDK_SDG_mol(molecule: any, V3000=False) -> str:
     return mol_str
 
 
+@cache_by_smiles(key=get_absolute_SMILES)
 def get_murko_framework(molecule: any) -> str:
     """This function takes the user input SMILES and returns.
 
@@ -122,7 +358,7 @@ def get_murko_framework(molecule: any) -> str:
         smiles (string): Murko Framework as SMILES.
     """
 
-    MurkoFragmenter = JClass(cdk_base + ".fragment.MurckoFragmenter")(True, 3)
+    MurkoFragmenter = _MurckoFragmenter(True, 3)
     MurkoFragmenter.generateFragments(molecule)
     if len(MurkoFragmenter.getFrameworks()) == 0:
         return "None"
@@ -140,24 +376,15 @@ def get_aromatic_ring_count(molecule) -> int:
         int: The number of aromatic rings present in the molecule.
     """
 
-    Cycles = JClass(cdk_base + ".graph.Cycles")
-    ElectronDonation = JClass(cdk_base + ".aromaticity.ElectronDonation")
-
-    Aromaticity = JClass(cdk_base + ".aromaticity.Aromaticity")(
-        ElectronDonation.daylight(),
-        Cycles.cdkAromaticSet(),
+    _aromaticity_daylight.apply(molecule)
+    MCBRings = _Cycles.mcb(molecule).toRingSet()
+    # markAromaticRings checks the aromaticity flags of all ring atoms and
+    # bonds on the Java side, so each ring costs a single call.
+    NumberOfAromaticRings = sum(
+        1
+        for RingContainer in MCBRings.atomContainers()
+        if _RingManipulator.markAromaticRings(RingContainer)
     )
-    Aromaticity.apply(molecule)
-    MCBRings = Cycles.mcb(molecule).toRingSet()
-    NumberOfAromaticRings = 0
-    for RingContainer in MCBRings.atomContainers():
-        AreAllRingBondsAromatic = True
-        for Bond in RingContainer.bonds():
-            if not Bond.isAromatic():
-                AreAllRingBondsAromatic = False
-                break
-        if AreAllRingBondsAromatic:
-            NumberOfAromaticRings += 1
     return NumberOfAromaticRings
 
 
@@ -171,13 +398,8 @@ def get_vander_waals_volume(molecule: any) -> float:
         float: The Van der Waals volume of the molecule.
     """
 
-    AtomContainerManipulator = JClass(
-        cdk_base + ".tools.manipulator.AtomContainerManipulator",
-    )
-    AtomContainerManipulator.percieveAtomTypesAndConfigureAtoms(molecule)
-    VABCVolume = JClass(
-        cdk_base + ".geometry.volume.VABCVolume",
-    )().calculate(molecule)
+    _AtomContainerManipulator.percieveAtomTypesAndConfigureAtoms(molecule)
+    VABCVolume = _vabc_volume.calculate(molecule)
     return VABCVolume
 
 
@@ -190,12 +412,64 @@ def get_CDK_MolecularFormula(molecule: any) -> str:
     Returns:
         str : MolecularFormula generated using CDK.
     """
-    MolecularFormulaManipulator = JClass(
-        cdk_base + ".tools.manipulator.MolecularFormulaManipulator"
-    )
+    MolecularFormula = _MolecularFormulaManipulator.getMolecularFormula(molecule)
+    return _MolecularFormulaManipulator.getString(MolecularFormula)
 
-    MolecularFormula = MolecularFormulaManipulator.getMolecularFormula(molecule)
-    return MolecularFormulaManipulator.getString(MolecularFormula)
+
+def get_CDK_descriptor_value(molecule: any, name: str):
+    """Calculate a CDK molecular descriptor.
+
+    The descriptor instances are shared, except the ALOGPDescriptor, which
+    keeps state while calculating and is reused per thread.
+
+    Args:
+        molecule (IAtomContainer): molecule given by the user.
+        name (str): Class name of the descriptor in org.openscience.cdk.qsar.descriptors.molecular, e.g. "TPSADescriptor".
+
+    Returns:
+        IDescriptorResult: The calculated value.
+    """
+    if name == "ALOGPDescriptor":
+        descriptor = _thread_local("alogp_descriptor", _ALOGPDescriptor)
+    else:
+        descriptor = _molecular_descriptors[name]
+    return descriptor.calculate(molecule).getValue()
+
+
+def get_total_exact_mass(molecule: any) -> float:
+    """Calculate the exact mass of a molecule including its hydrogens.
+
+    Args:
+        molecule (IAtomContainer): molecule given by the user.
+
+    Returns:
+        float: Total exact mass.
+    """
+    return _AtomContainerManipulator.getTotalExactMass(molecule)
+
+
+def get_total_formal_charge(molecule: any) -> int:
+    """Calculate the sum of the formal charges of a molecule.
+
+    Args:
+        molecule (IAtomContainer): molecule given by the user.
+
+    Returns:
+        int: Total formal charge.
+    """
+    return _AtomContainerManipulator.getTotalFormalCharge(molecule)
+
+
+def get_ring_count(molecule: any) -> int:
+    """Count the rings in the minimum cycle basis of a molecule.
+
+    Args:
+        molecule (IAtomContainer): molecule given by the user.
+
+    Returns:
+        int: Number of minimal rings.
+    """
+    return _Cycles.mcb(molecule).numberOfCycles()
 
 
 def get_CDK_descriptors(molecule: any) -> Union[tuple, str]:
@@ -210,102 +484,147 @@ def get_CDK_descriptors(molecule: any) -> Union[tuple, str]:
     """
     SDGMol = get_CDK_SDG(molecule)
     if SDGMol:
-        AtomCountDescriptor = (
-            JClass(cdk_base + ".qsar.descriptors.molecular.AtomCountDescriptor")()
-            .calculate(SDGMol)
-            .getValue()
-        )
+        AtomCountDescriptor = get_CDK_descriptor_value(
+            SDGMol, "AtomCountDescriptor"
+        ).intValue()
         HeavyAtomsC = SDGMol.getAtomCount()
-        WeightDescriptor = (
-            JClass(cdk_base + ".qsar.descriptors.molecular.WeightDescriptor")()
-            .calculate(SDGMol)
-            .getValue()
-            .toString()
-        )
-        TotalExactMass = JClass(
-            cdk_base + ".tools.manipulator.AtomContainerManipulator",
-        ).getTotalExactMass(SDGMol)
-        ALogP = (
-            JClass(cdk_base + ".qsar.descriptors.molecular.ALOGPDescriptor")()
-            .calculate(SDGMol)
-            .getValue()
-        )
-        NumRotatableBonds = (
-            JClass(
-                cdk_base + ".qsar.descriptors.molecular.RotatableBondsCountDescriptor",
-            )()
-            .calculate(SDGMol)
-            .getValue()
-        )
-        TPSADescriptor = (
-            JClass(cdk_base + ".qsar.descriptors.molecular.TPSADescriptor")()
-            .calculate(SDGMol)
-            .getValue()
-            .toString()
-        )
-        HBondAcceptorCountDescriptor = (
-            JClass(
-                cdk_base + ".qsar.descriptors.molecular.HBondAcceptorCountDescriptor",
-            )()
-            .calculate(SDGMol)
-            .getValue()
-        )
-        HBondDonorCountDescriptor = (
-            JClass(
-                cdk_base + ".qsar.descriptors.molecular.HBondAcceptorCountDescriptor",
-            )()
-            .calculate(SDGMol)
-            .getValue()
-        )
-        RuleOfFiveDescriptor = (
-            JClass(cdk_base + ".qsar.descriptors.molecular.RuleOfFiveDescriptor")()
-            .calculate(SDGMol)
-            .getValue()
-        )
+        WeightDescriptor = get_CDK_descriptor_value(
+            SDGMol, "WeightDescriptor"
+        ).doubleValue()
+        TotalExactMass = get_total_exact_mass(SDGMol)
+        ALogP = get_CDK_descriptor_value(SDGMol, "ALOGPDescriptor").get(0)
+        NumRotatableBonds = get_CDK_descriptor_value(
+            SDGMol, "RotatableBondsCountDescriptor"
+        ).intValue()
+        TPSADescriptor = get_CDK_descriptor_value(
+            SDGMol, "TPSADescriptor"
+        ).doubleValue()
+        HBondAcceptorCountDescriptor = get_CDK_descriptor_value(
+            SDGMol, "HBondAcceptorCountDescriptor"
+        ).intValue()
+        HBondDonorCountDescriptor = get_CDK_descriptor_value(
+            SDGMol, "HBondDonorCountDescriptor"
+        ).intValue()
+        RuleOfFiveDescriptor = get_CDK_descriptor_value(
+            SDGMol, "RuleOfFiveDescriptor"
+        ).intValue()
         AromaticRings = get_aromatic_ring_count(SDGMol)
         QEDWeighted = None
-        FormalCharge = JClass(
-            cdk_base + ".tools.manipulator.AtomContainerManipulator",
-        ).getTotalFormalCharge(SDGMol)
-        FractionalCSP3Descriptor = (
-            JClass(cdk_base + ".qsar.descriptors.molecular.FractionalCSP3Descriptor")()
-            .calculate(SDGMol)
-            .getValue()
-            .toString()
-        )
-        NumRings = (
-            JClass(
-                cdk_base + ".graph.Cycles",
-            )
-            .mcb(SDGMol)
-            .numberOfCycles()
-        )
+        FormalCharge = get_total_formal_charge(SDGMol)
+        FractionalCSP3Descriptor = get_CDK_descriptor_value(
+            SDGMol, "FractionalCSP3Descriptor"
+        ).doubleValue()
+        NumRings = get_ring_count(SDGMol)
         VABCVolume = get_vander_waals_volume(SDGMol)
 
         return (
-            int(str(AtomCountDescriptor)),
+            int(AtomCountDescriptor),
             int(HeavyAtomsC),
-            float("{:.2f}".format(float(str(WeightDescriptor)))),
-            float("{:.5f}".format(float(str(TotalExactMass)))),
-            float("{:.2f}".format(float(str(ALogP).split(",")[0]))),
-            int(str(NumRotatableBonds)),
-            float("{:.2f}".format(float(str(TPSADescriptor)))),
-            int(str(HBondAcceptorCountDescriptor)),
-            int(str(HBondDonorCountDescriptor)),
-            int(str(HBondAcceptorCountDescriptor)),
-            int(str(HBondDonorCountDescriptor)),
-            int(str(RuleOfFiveDescriptor)),
+            round(WeightDescriptor, 2),
+            round(TotalExactMass, 5),
+            round(ALogP, 2),
+            int(NumRotatableBonds),
+            round(TPSADescriptor, 2),
+            int(HBondAcceptorCountDescriptor),
+            int(HBondDonorCountDescriptor),
+            int(HBondAcceptorCountDescriptor),
+            int(HBondDonorCountDescriptor),
+            int(RuleOfFiveDescriptor),
             int(AromaticRings),
             str(QEDWeighted),
             int(FormalCharge),
-            float("{:.2f}".format(float(str(FractionalCSP3Descriptor)))),
+            round(FractionalCSP3Descriptor, 2),
             int(NumRings),
-            float("{:.2f}".format(float(str(VABCVolume)))),
+            round(VABCVolume, 2),
         )
     else:
         return "Check input and try again!"
 
 
+def _get_PubChem_fingerprint(molecule: any):
+    """Prepare a molecule and generate its PubChem fingerprint.
+
+    Atom types are perceived, hydrogens made explicit and the CDK aromaticity
+    model applied before fingerprinting, as the PubChem fingerprinter expects.
+    This is done on a copy, so the molecule given by the user is not modified.
+
+    Args:
+        molecule (IAtomContainer): molecule given by the user.
+
+    Returns:
+        IBitFingerprint: PubChem fingerprint of the molecule.
+    """
+    molecule = molecule.clone()
+    _AtomContainerManipulator.percieveAtomTypesAndConfigureAtoms(molecule)
+    _hydrogen_adder.addImplicitHydrogens(molecule)
+    _AtomContainerManipulator.convertImplicitToExplicitHydrogens(molecule)
+    _aromaticity_cdk.apply(molecule)
+
+    fingerprinter = _thread_local(
+        "pubchem_fingerprinter",
+        lambda: _PubchemFingerprinter(_SilentChemObjectBuilder.getInstance()),
+    )
+    return fingerprinter.getBitFingerprint(molecule)
+
+
+@cache_by_smiles(key=get_absolute_SMILES, maxsize=65536)
+def get_PubChem_fingerprint(molecule: any) -> np.ndarray:
+    """Generate the PubChem fingerprint of a molecule packed into 64 bit words.
+
+    Args:
+        molecule (IAtomContainer): molecule given by the user.
+
+    Returns:
+        np.ndarray: Read-only array of 14 uint64 words holding the 881 fingerprint bits.
+    """
+    words = np.asarray(
+        _get_PubChem_fingerprint(molecule).asBitSet().toLongArray(),
+        dtype=np.int64,
+    ).view(np.uint64)
+    fingerprint = np.pad(words, (0, _PUBCHEM_FINGERPRINT_WORDS - words.size))
+    fingerprint.flags.writeable = False
+    return fingerprint
+
+
+def _get_popcount(fingerprints: np.ndarray) -> np.ndarray:
+    """Count the set bits of packed fingerprints along the last axis.
+
+    Args:
+        fingerprints (np.ndarray): uint64 words of one or more fingerprints.
+
+    Returns:
+        np.ndarray: Number of set bits per fingerprint.
+    """
+    return _POPCOUNT_TABLE[fingerprints.view(np.uint8)].sum(axis=-1)
+
+
+def _get_tanimoto_matrix(
+    query_fingerprints: np.ndarray,
+    target_fingerprints: np.ndarray,
+) -> np.ndarray:
+    """Calculate the Tanimoto similarities between two sets of packed.
+
+    fingerprints in a single vectorised operation.
+
+    Args:
+        query_fingerprints (np.ndarray): (M, 14) array of packed fingerprints.
+        target_fingerprints (np.ndarray): (N, 14) array of packed fingerprints.
+
+    Returns:
+        np.ndarray: (M, N) Tanimoto similarities, 0.0 where neither fingerprint has bits set.
+    """
+    common = _get_popcount(
+        query_fingerprints[:, None, :] & target_fingerprints[None, :, :],
+    )
+    union = (
+        _get_popcount(query_fingerprints)[:, None]
+        + _get_popcount(target_fingerprints)[None, :]
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        similarity = common / (union - common)
+    return np.where(union == 0, 0.0, similarity)
+
+
 def get_tanimoto_similarity_PubChem_CDK(mol1: any, mol2: any) -> str:
     """Calculate the Tanimoto similarity index between two molecules using.
 
@@ -319,50 +638,37 @@ def get_tanimoto_similarity_PubChem_CDK(mol1: any, mol2: any) -> str:
         str: The Tanimoto similarity as a string with 5 decimal places, or an error message.
     """
 
-    Tanimoto = JClass(cdk_base + ".similarity.Tanimoto")
-    SCOB = JClass(cdk_base + ".silent.SilentChemObjectBuilder")
-    PubchemFingerprinter = JClass(cdk_base + ".fingerprint.PubchemFingerprinter")(
-        SCOB.getInstance(),
-    )
-    CDKHydrogenAdder = JClass(cdk_base + ".tools.CDKHydrogenAdder").getInstance(
-        SCOB.getInstance(),
-    )
-    AtomContainerManipulator = JClass(
-        cdk_base + ".tools.manipulator.AtomContainerManipulator",
-    )
-    Cycles = JClass(cdk_base + ".graph.Cycles")
-    ElectronDonation = JClass(cdk_base + ".aromaticity.ElectronDonation")
-    Aromaticity = JClass(cdk_base + ".aromaticity.Aromaticity")(
-        ElectronDonation.cdk(),
-        Cycles.cdkAromaticSet(),
-    )
     if mol1 and mol2:
-        # Perceive atom types and configure atoms
-        AtomContainerManipulator.percieveAtomTypesAndConfigureAtoms(mol1)
-        AtomContainerManipulator.percieveAtomTypesAndConfigureAtoms(mol2)
+        Similarity = _get_tanimoto_matrix(
+            get_PubChem_fingerprint(mol1)[None, :],
+            get_PubChem_fingerprint(mol2)[None, :],
+        )[0, 0]
+        return "{:.5f}".format(Similarity)
+    else:
+        return "Check the SMILES string for errors"
 
-        # add Implicit Hydrogens
-        CDKHydrogenAdder.addImplicitHydrogens(mol1)
-        CDKHydrogenAdder.addImplicitHydrogens(mol2)
 
-        # Convert implicit to explicit Hydrogens
-        AtomContainerManipulator.convertImplicitToExplicitHydrogens(mol1)
-        AtomContainerManipulator.convertImplicitToExplicitHydrogens(mol2)
+def get_tanimoto_similarity_PubChem_CDK_matrix(
+    molecules: List[any],
+) -> List[List[str]]:
+    """Calculate the PubChem Tanimoto similarity between every pair of.
 
-        # Apply Aromaticity
-        Aromaticity.apply(mol1)
-        Aromaticity.apply(mol2)
+    molecules.
 
-        # Generate BitSets using PubChemFingerprinter
-        fingerprint1 = PubchemFingerprinter.getBitFingerprint(mol1).asBitSet()
-        fingerprint2 = PubchemFingerprinter.getBitFingerprint(mol2).asBitSet()
+    Each fingerprint is generated once and all pairs are compared in a single
+    vectorised operation.
 
-        # Calculate Tanimoto similarity
-        Similarity = Tanimoto.calculate(fingerprint1, fingerprint2)
+    Args:
+        molecules (List[IAtomContainer]): molecules given by the user.
 
-        return "{:.5f}".format(float(str(Similarity)))
-    else:
-        return "Check the SMILES string for errors"
+    Returns:
+        List[List[str]]: Tanimoto similarities with 5 decimal places, rows and columns in the order of the molecules.
+    """
+    fingerprints = np.vstack(
+        [get_PubChem_fingerprint(molecule) for molecule in molecules],
+    )
+    Similarities = _get_tanimoto_matrix(fingerprints, fingerprints)
+    return [["{:.5f}".format(Similarity) for Similarity in row] for row in Similarities]
 
 
 def get_tanimoto_similarity_ECFP_CDK(
@@ -383,28 +689,25 @@ def get_tanimoto_similarity_ECFP_CDK(
     Returns:
         str: The Tanimoto similarity as a string with 5 decimal places, or an error message.
     """
-    Tanimoto = JClass(cdk_base + ".similarity.Tanimoto")
-    CircularFingerprinter = JClass(
-        cdk_base + ".fingerprint.CircularFingerprinter",
-    )()
     if ECFP == 2:
-        fingerprinter_class = CircularFingerprinter.CLASS_ECFP2
+        fingerprinter_class = _CircularFingerprinter.CLASS_ECFP2
     elif ECFP == 4:
-        fingerprinter_class = CircularFingerprinter.CLASS_ECFP4
+        fingerprinter_class = _CircularFingerprinter.CLASS_ECFP4
     elif ECFP == 6:
-        fingerprinter_class = CircularFingerprinter.CLASS_ECFP6
+        fingerprinter_class = _CircularFingerprinter.CLASS_ECFP6
     else:
         return "only ECFP 2/4/6 allowed"
 
-    CircularFingerprinter_ECFP = JClass(
-        cdk_base + ".fingerprint.CircularFingerprinter",
-    )(fingerprinter_class, bitset_len)
+    CircularFingerprinter_ECFP = _CircularFingerprinter(
+        fingerprinter_class,
+        bitset_len,
+    )
 
     if mol1 and mol2:
         fingerprint1 = CircularFingerprinter_ECFP.getBitFingerprint(mol1)
         fingerprint2 = CircularFingerprinter_ECFP.getBitFingerprint(mol2)
         # Calculate Tanimoto similarity
-        Similarity = Tanimoto.calculate(fingerprint1, fingerprint2)
+        Similarity = _Tanimoto.calculate(fingerprint1, fingerprint2)
         return "{:.5f}".format(float(str(Similarity)))
     else:
         return "Check the SMILES string for errors"
@@ -461,105 +764,83 @@ def get_cip_annotation(molecule: any) -> str:
         str: A CIP annotated molecule block.
     """
     SDGMol = get_CDK_SDG(molecule)
-    centres_base = "com.simolecule.centres"
-    Cycles = JClass(cdk_base + ".graph.Cycles")
-    IBond = JClass(cdk_base + ".interfaces.IBond")
-    IStereoElement = JClass(cdk_base + ".interfaces.IStereoElement")
-    Stereocenters = JClass(cdk_base + ".stereo.Stereocenters")
-    StandardGenerator = JClass(
-        cdk_base + ".renderer.generators.standard.StandardGenerator",
-    )
 
-    BaseMol = JClass(centres_base + ".BaseMol")
-    CdkLabeller = JClass(centres_base + ".CdkLabeller")
-    Descriptor = JClass(centres_base + ".Descriptor")
+    # Label stereo elements, unless there is no defined stereo
+    if SDGMol.stereoElements().iterator().hasNext():
+        _CdkLabeller.label(SDGMol)
+
+        # Update to label appropriately for racemic and relative stereochemistry
+        for se in SDGMol.stereoElements():
+            if se.getConfigClass() == _IStereoElement.TH and se.getGroupInfo() != 0:
+                focus = se.getFocus()
+                label = focus.getProperty(_BaseMol.CIP_LABEL_KEY)
+                if (
+                    isinstance(label, _Descriptor)
+                    and label != _Descriptor.ns
+                    and label != _Descriptor.Unknown
+                ):
+                    if (se.getGroupInfo() & _IStereoElement.GRP_RAC) != 0:
+                        inv = None
+                        if label == _Descriptor.R:
+                            inv = _Descriptor.S
+                        elif label == _Descriptor.S:
+                            inv = _Descriptor.R
+                        if inv is not None:
+                            focus.setProperty(
+                                _BaseMol.CIP_LABEL_KEY,
+                                label.toString() + inv.name(),
+                            )
+                    elif (se.getGroupInfo() & _IStereoElement.GRP_REL) != 0:
+                        if label == _Descriptor.R or label == _Descriptor.S:
+                            focus.setProperty(
+                                _BaseMol.CIP_LABEL_KEY,
+                                label.toString() + "*",
+                            )
+
+    # Annotate atoms and bonds in a single pass each. A CIP label (or
+    # conformation index) takes precedence, stereocenters without one are
+    # marked as unspecified with "(?)".
+    ANNOTATION_LABEL = _StandardGenerator.ANNOTATION_LABEL
+    ITALIC_DISPLAY_PREFIX = _StandardGenerator.ITALIC_DISPLAY_PREFIX
+    CIP_LABEL_KEY = _BaseMol.CIP_LABEL_KEY
+    CONF_INDEX = _BaseMol.CONF_INDEX
+    Tetracoordinate = _Stereocenters.Type.Tetracoordinate
+    Tricoordinate = _Stereocenters.Type.Tricoordinate
+    DOUBLE = _IBond.Order.DOUBLE
+    stereocenters = _Stereocenters.of(SDGMol)
 
-    stereocenters = Stereocenters.of(SDGMol)
     for atom in SDGMol.atoms():
+        label = atom.getProperty(CONF_INDEX)
+        if label is None:
+            label = atom.getProperty(CIP_LABEL_KEY)
+        if label is not None:
+            atom.setProperty(ANNOTATION_LABEL, ITALIC_DISPLAY_PREFIX + label.toString())
+            continue
+        atomIdx = atom.getIndex()
         if (
-            stereocenters.isStereocenter(atom.getIndex())
-            and stereocenters.elementType(atom.getIndex())
-            == Stereocenters.Type.Tetracoordinate
+            stereocenters.isStereocenter(atomIdx)
+            and stereocenters.elementType(atomIdx) == Tetracoordinate
         ):
-            atom.setProperty(StandardGenerator.ANNOTATION_LABEL, "(?)")
+            atom.setProperty(ANNOTATION_LABEL, "(?)")
 
-    # Iterate over bonds
     for bond in SDGMol.bonds():
-        if bond.getOrder() != IBond.Order.DOUBLE:
+        label = bond.getProperty(CIP_LABEL_KEY)
+        if label is not None:
+            bond.setProperty(ANNOTATION_LABEL, ITALIC_DISPLAY_PREFIX + label.toString())
+            continue
+        if bond.getOrder() != DOUBLE:
             continue
         begIdx = bond.getBegin().getIndex()
         endIdx = bond.getEnd().getIndex()
         if (
-            stereocenters.elementType(
-                begIdx,
-            )
-            == Stereocenters.Type.Tricoordinate
-            and stereocenters.elementType(endIdx) == Stereocenters.Type.Tricoordinate
+            stereocenters.elementType(begIdx) == Tricoordinate
+            and stereocenters.elementType(endIdx) == Tricoordinate
             and stereocenters.isStereocenter(begIdx)
             and stereocenters.isStereocenter(endIdx)
         ):
             # Check if not in a small ring <7
-            if Cycles.smallRingSize(bond, 7) == 0:
-                bond.setProperty(StandardGenerator.ANNOTATION_LABEL, "(?)")
-
-    # no defined stereo?
-    if not SDGMol.stereoElements().iterator().hasNext():
-        return SDGMol
-
-    # Call the Java method
-    CdkLabeller.label(SDGMol)
-
-    # Update to label appropriately for racemic and relative stereochemistry
-    for se in SDGMol.stereoElements():
-        if se.getConfigClass() == IStereoElement.TH and se.getGroupInfo() != 0:
-            focus = se.getFocus()
-            label = focus.getProperty(BaseMol.CIP_LABEL_KEY)
-            if (
-                isinstance(label, Descriptor)
-                and label != Descriptor.ns
-                and label != Descriptor.Unknown
-            ):
-                if (se.getGroupInfo() & IStereoElement.GRP_RAC) != 0:
-                    inv = None
-                    if label == Descriptor.R:
-                        inv = Descriptor.S
-                    elif label == Descriptor.S:
-                        inv = Descriptor.R
-                    if inv is not None:
-                        focus.setProperty(
-                            BaseMol.CIP_LABEL_KEY,
-                            label.toString() + inv.name(),
-                        )
-                elif (se.getGroupInfo() & IStereoElement.GRP_REL) != 0:
-                    if label == Descriptor.R or label == Descriptor.S:
-                        focus.setProperty(
-                            BaseMol.CIP_LABEL_KEY,
-                            label.toString() + "*",
-                        )
-
-    # Iterate over atoms
-    for atom in SDGMol.atoms():
-        if atom.getProperty(BaseMol.CONF_INDEX) is not None:
-            atom.setProperty(
-                StandardGenerator.ANNOTATION_LABEL,
-                StandardGenerator.ITALIC_DISPLAY_PREFIX
-                + atom.getProperty(BaseMol.CONF_INDEX).toString(),
-            )
-        elif atom.getProperty(BaseMol.CIP_LABEL_KEY) is not None:
-            atom.setProperty(
-                StandardGenerator.ANNOTATION_LABEL,
-                StandardGenerator.ITALIC_DISPLAY_PREFIX
-                + atom.getProperty(BaseMol.CIP_LABEL_KEY).toString(),
-            )
-
-    # Iterate over bonds
-    for bond in SDGMol.bonds():
-        if bond.getProperty(BaseMol.CIP_LABEL_KEY) is not None:
-            bond.setProperty(
-                StandardGenerator.ANNOTATION_LABEL,
-                StandardGenerator.ITALIC_DISPLAY_PREFIX
-                + bond.getProperty(BaseMol.CIP_LABEL_KEY).toString(),
-            )
+            if _Cycles.smallRingSize(bond, 7) == 0:
+                bond.setProperty(ANNOTATION_LABEL, "(?)")
 
     return SDGMol
 
@@ -578,11 +859,7 @@ def get_CXSMILES(molecule: any) -> str:
         str: CXSMILES representation with 2D atom coordinates.
     """
     SDGMol = get_CDK_SDG(molecule)
-    SmiFlavor = JClass(cdk_base + ".smiles.SmiFlavor")
-    SmilesGenerator = JClass(cdk_base + ".smiles.SmilesGenerator")(
-        SmiFlavor.Absolute | SmiFlavor.CxSmilesWithCoords,
-    )
-    CXSMILES = SmilesGenerator.create(SDGMol)
+    CXSMILES = _cxsmiles_generator.create(SDGMol)
     return str(CXSMILES)
 
 
@@ -598,14 +875,22 @@ def get_canonical_SMILES(molecule: any) -> str:
         str: Canonical SMILES representation with 2D atom coordinates.
     """
     SDGMol = get_CDK_SDG(molecule)
-    SmiFlavor = JClass(cdk_base + ".smiles.SmiFlavor")
-    SmilesGenerator = JClass(
-        cdk_base + ".smiles.SmilesGenerator",
-    )(SmiFlavor.Absolute)
-    CanonicalSMILES = SmilesGenerator.create(SDGMol)
+    CanonicalSMILES = _absolute_smiles_generator.create(SDGMol)
     return str(CanonicalSMILES)
 
 
+@cache_by_smiles(key=get_absolute_SMILES)
+def _get_InChI_and_InChIKey(molecule: any) -> tuple:
+    """Generate the InChI and InChIKey of a molecule with one InChI generator.
+
+    Callers usually want both, e.g. /convert/formats, so both are cached
+    together and the second one is a cache hit.
+    """
+    SDGMol = get_CDK_SDG(molecule)
+    InChIGenerator = _InChIGeneratorFactory.getInstance().getInChIGenerator(SDGMol)
+    return InChIGenerator.getInchi(), InChIGenerator.getInchiKey()
+
+
 def get_InChI(molecule: any, InChIKey=False) -> str:
     """Generate InChI or InChIKey from the given SMILES string.
 
@@ -616,17 +901,13 @@ def get_InChI(molecule: any, InChIKey=False) -> str:
     Returns:
         str: InChI or InChIKey string.
     """
-    SDGMol = get_CDK_SDG(molecule)
-    InChIGeneratorFactory = JClass(cdk_base + ".inchi.InChIGeneratorFactory")
-    InChI = InChIGeneratorFactory.getInstance().getInChIGenerator(SDGMol).getInchi()
+    inchi, inchikey = _get_InChI_and_InChIKey(molecule)
     if InChIKey:
-        InChIKey = (
-            InChIGeneratorFactory.getInstance().getInChIGenerator(SDGMol).getInchiKey()
-        )
-        return InChIKey
-    return InChI
+        return inchikey
+    return inchi
 
 
+@functools.lru_cache(maxsize=8192)
 def get_smiles_opsin(input_text: str) -> str:
     """Convert IUPAC chemical name to SMILES notation using OPSIN.
 
@@ -656,6 +937,37 @@ def get_smiles_opsin(input_text: str) -> str:
         )
 
 
+def _get_HOSE_codes_for_atoms(
+    molecule: any,
+    atom_indices: range,
+    noOfSpheres: int,
+    ringsize: bool,
+) -> List[str]:
+    """Generate CDK HOSECodes for a range of atoms of a molecule.
+
+    Args:
+        molecule (IAtomContainer): molecule the atoms belong to.
+        atom_indices (range): Indices of the atoms to generate HOSECodes for.
+        noOfSpheres (int): Number of spheres for HOSECode generation.
+        ringsize (bool): Whether to consider ring size for HOSECode generation.
+
+    Returns:
+        List[str]: HOSECodes in the order of the atom indices.
+    """
+    HOSECodeGenerator = _HOSECodeGenerator()
+    return [
+        str(
+            HOSECodeGenerator.getHOSECode(
+                molecule,
+                molecule.getAtom(index),
+                noOfSpheres,
+                ringsize,
+            ),
+        )
+        for index in atom_indices
+    ]
+
+
 async def get_CDK_HOSE_codes(
     molecule: any,
     noOfSpheres: int,
@@ -663,6 +975,9 @@ async def get_CDK_HOSE_codes(
 ) -> List[str]:
     """Generate CDK-generated HOSECodes for the given SMILES.
 
+    Larger molecules are split into blocks of atoms which are processed
+    concurrently on the batch worker threads.
+
     Args:
         molecule (IAtomContainer): molecule given by the user.
         noOfSpheres (int): Number of spheres for HOSECode generation.
@@ -671,15 +986,33 @@ async def get_CDK_HOSE_codes(
     Returns:
         List[str]: List of CDK-generated HOSECodes.
     """
-    HOSECodeGenerator = JClass(cdk_base + ".tools.HOSECodeGenerator")()
-    HOSECodes = []
-    atoms = molecule.atoms()
-    for atom in atoms:
-        moleculeHOSECode = HOSECodeGenerator.getHOSECode(
+    atom_count = molecule.getAtomCount()
+    blocks = [
+        range(start, min(start + _HOSE_ATOMS_PER_TASK, atom_count))
+        for start in range(0, atom_count, _HOSE_ATOMS_PER_TASK)
+    ]
+    if len(blocks) <= 1:
+        return _get_HOSE_codes_for_atoms(
             molecule,
-            atom,
+            range(atom_count),
             noOfSpheres,
             ringsize,
         )
-        HOSECodes.append(str(moleculeHOSECode))
-    return HOSECodes
+
+    # HOSECodeGenerator marks visited atoms on the container, so every task
+    # works on its own copy of the molecule.
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(
+        *(
+            loop.run_in_executor(
+                _executor,
+                _get_HOSE_codes_for_atoms,
+                molecule.clone(),
+                atom_indices,
+                noOfSpheres,
+                ringsize,
+            )
+            for atom_indices in blocks
+        ),
+    )
+    return [HOSECode for HOSECodes in results for HOSECode in HOSECodes]
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from chembl_structure_pipeline import standardizer
+import functools
+import re
+
 from rdkit import Chem
 
 from app.exception_handlers import InvalidInputException
@@ -8,6 +10,10 @@ from app.modules.toolkits.cdk_wrapper import get_CDK_IAtomContainer
 from app.modules.toolkits.cdk_wrapper import get_CDK_SDG_mol
 from app.modules.toolkits.openbabel_wrapper import get_ob_mol
 
+# Blank input, control characters and input longer than any real molecule
+# are rejected before they reach a toolkit. Surrounding whitespace is ignored.
+_SMILES_RE = re.compile(r"[^\x00-\x1f\x7f]{1,10000}")
+
 
 def parse_input(input: str, framework: str = "rdkit", standardize: bool = False):
     """Parse and check if the input is valid.
@@ -27,12 +33,29 @@ def parse_input(input: str, framework: str = "rdkit", standardize: bool = False)
         return parse_SMILES(input, framework, standardize)
 
 
+def check_SMILES(smiles: str) -> None:
+    """Check that a string can be a SMILES without parsing it.
+
+    Args:
+        smiles (str): Input SMILES string.
+
+    Raises:
+        InvalidInputException: If the string is blank, too long or contains control characters.
+    """
+    if isinstance(smiles, str) and not _SMILES_RE.fullmatch(smiles.strip()):
+        raise InvalidInputException(name="smiles", value=smiles)
+
+
 def parse_SMILES(smiles: str, framework: str = "rdkit", standardize: bool = False):
     """Check whether the input SMILES string is valid.
 
     If not, attempt to standardize
     the molecule using the ChEMBL standardization pipeline.
 
+    Blank or overlong strings and strings with control characters are
+    rejected without parsing. RDKit and CDK molecules are cached on the
+    arguments, every call returns its own copy.
+
     Args:
         smiles (str): Input SMILES string.
         framework (str): Framework to use for parsing. Default is "rdkit".
@@ -42,6 +65,27 @@ def parse_SMILES(smiles: str, framework: str = "rdkit", standardize: bool = Fals
         Chem.Mol or None: Valid molecule object or None if an error occurs.
             If an error occurs during SMILES parsing, an error message is returned.
     """
+    check_SMILES(smiles)
+
+    if framework not in ("rdkit", "cdk"):
+        return _parse_SMILES(smiles, framework, standardize)
+
+    mol = _parse_SMILES_cached(smiles, framework, standardize)
+    if not mol:
+        return mol
+    if isinstance(mol, Chem.Mol):
+        return Chem.Mol(mol)
+    return mol.clone()
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_SMILES_cached(smiles: str, framework: str, standardize: bool):
+    """Parse a SMILES string once, see parse_SMILES."""
+    return _parse_SMILES(smiles, framework, standardize)
+
+
+def _parse_SMILES(smiles: str, framework: str, standardize: bool):
+    """Parse a SMILES string with the given framework, see parse_SMILES."""
     try:
         smiles = smiles.replace(" ", "+")
         if framework == "rdkit":
@@ -52,6 +96,8 @@ def parse_SMILES(smiles: str, framework: str = "rdkit", standardize: bool = Fals
             else:
                 mol = Chem.MolFromSmiles(smiles)
             if standardize:
+                from chembl_structure_pipeline import standardizer
+
                 mol_block = Chem.MolToMolBlock(mol)
                 standardized_mol = standardizer.standardize_molblock(mol_block)
                 mol = Chem.MolFromMolBlock(standardized_mol)
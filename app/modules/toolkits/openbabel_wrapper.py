@@ -6,14 +6,17 @@ from openbabel import pybel
 from app.exception_handlers import InvalidInputException
 
 
-def get_ob_canonical_SMILES(smiles: str) -> str:
-    """Convert a SMILES string to Canonical SMILES.
+def _read_ob_mol(smiles: str) -> ob.OBMol:
+    """Parse a SMILES string into an Open Babel molecule.
 
     Args:
         smiles (str): Input SMILES string.
 
     Returns:
-        str: Canonical SMILES string.
+        ob.OBMol: The parsed molecule.
+
+    Raises:
+        InvalidInputException: If the SMILES string could not be parsed.
     """
     smiles = smiles.replace(" ", "+")
 
@@ -21,15 +24,49 @@ def get_ob_canonical_SMILES(smiles: str) -> str:
     mol = ob.OBMol()
 
     conv = ob.OBConversion()
-    conv.SetInAndOutFormats("smi", "can")
+    conv.SetInFormat("smi")
     conv.ReadString(mol, smiles)
 
     if mol.NumAtoms() <= 0:
         raise InvalidInputException(name="smiles", value=smiles)
-    else:
-        canSMILES = conv.WriteString(mol)
-        canSMILES = canSMILES.strip()  # Remove leading/trailing whitespace
-        return canSMILES
+    return mol
+
+
+def _write_ob_canonical_SMILES(mol: ob.OBMol) -> str:
+    conv = ob.OBConversion()
+    conv.SetOutFormat("can")
+    return conv.WriteString(mol).strip()  # Remove leading/trailing whitespace
+
+
+def _write_ob_InChI(mol: ob.OBMol) -> tuple:
+    conv = ob.OBConversion()
+    conv.SetOutFormat("inchi")
+    inchi = conv.WriteString(mol).strip()  # Remove leading/trailing whitespace
+    conv.SetOptions("K", conv.OUTOPTIONS)
+    inchikey = conv.WriteString(mol).rstrip()
+    return inchi, inchikey
+
+
+def _write_ob_mol_block(mol: ob.OBMol) -> str:
+    # Generate 2D coordinates
+    obBuilder = ob.OBBuilder()
+    obBuilder.Build(mol)
+
+    conv = ob.OBConversion()
+    conv.SetOutFormat("mol")
+    return conv.WriteString(mol).strip()  # Remove leading/trailing whitespace
+
+
+def get_ob_canonical_SMILES(smiles: str) -> str:
+    """Convert a SMILES string to Canonical SMILES.
+
+    Args:
+        smiles (str): Input SMILES string.
+
+    Returns:
+        str: Canonical SMILES string.
+    """
+    return _write_ob_canonical_SMILES(_read_ob_mol(smiles))
 
 
 def get_ob_InChI(smiles: str, InChIKey: bool = False) -> str:
@@ -42,27 +79,30 @@ def get_ob_InChI(smiles: str, InChIKey: bool = False) -> str:
     Returns:
         str: InChI string or InChIKey string if InChIKey is True.
     """
+    inchi, inchikey = _write_ob_InChI(_read_ob_mol(smiles))
+    if InChIKey:
+        return inchikey
+    return inchi
 
-    smiles = smiles.replace(" ", "+")
 
-    # Create an Open Babel molecule object
-    mol = ob.OBMol()
+def get_ob_formats(smiles: str) -> dict:
+    """Convert a SMILES string to a 2D mol block, Canonical SMILES, InChI and InChIKey.
 
-    # Create OBConversion
-    conv = ob.OBConversion()
-    conv.SetInAndOutFormats("smi", "inchi")
-    conv.ReadString(mol, smiles)
+    The SMILES string is parsed once for all four formats.
 
-    if mol.NumAtoms() <= 0:
-        raise InvalidInputException(name="smiles", value=smiles)
-    else:
-        inchi = conv.WriteString(mol)
-        inchi = inchi.strip()  # Remove leading/trailing whitespace
-        if InChIKey:
-            conv.SetOptions("K", conv.OUTOPTIONS)
-            inchikey_ = conv.WriteString(mol).rstrip()
-            return inchikey_
-        return inchi
+    Args:
+        smiles (str): Input SMILES string.
+
+    Returns:
+        dict: The "mol", "canonicalsmiles", "inchi" and "inchikey" of the molecule.
+    """
+    mol = _read_ob_mol(smiles)
+    response = {}
+    response["canonicalsmiles"] = _write_ob_canonical_SMILES(mol)
+    response["inchi"], response["inchikey"] = _write_ob_InChI(mol)
+    # Building the coordinates changes the molecule, so it comes last
+    response["mol"] = _write_ob_mol_block(mol)
+    return response
 
 
 def get_ob_mol(smiles: str, threeD: bool = False, depict: bool = False) -> str:
@@ -94,20 +134,4 @@ def get_ob_mol(smiles: str, threeD: bool = False, depict: bool = False) -> str:
                 mol.removeh()
                 return mol.write("mol")
 
-    # Create an Open Babel molecule object
-    mol = ob.OBMol()
-
-    conv = ob.OBConversion()
-    conv.SetInAndOutFormats("smi", "mol")
-    conv.ReadString(mol, smiles)
-
-    if mol.NumAtoms() <= 0:
-        raise InvalidInputException(name="smiles", value=smiles)
-    else:
-        # Generate 2D coordinates
-        obBuilder = ob.OBBuilder()
-        obBuilder.Build(mol)
-
-        mol_block = conv.WriteString(mol)
-        mol_block = mol_block.strip()  # Remove leading/trailing whitespace
-        return mol_block
+    return _write_ob_mol_block(_read_ob_mol(smiles))
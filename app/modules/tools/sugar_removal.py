@@ -1,6 +1,14 @@
 from __future__ import annotations
 
 import app.modules.toolkits.cdk_wrapper as cdk
+from app.modules.toolkits.cdk_wrapper import get_absolute_SMILES
+from app.modules.toolkits.cdk_wrapper import get_chem_object_builder
+
+# The Java class is resolved once. SugarRemovalUtility instances are still
+# created per call, as their settings are changed by some of the functions.
+_SugarRemovalUtility = cdk.lazy_jclass(
+    "de.unijena.cheminf.deglycosylation.SugarRemovalUtility"
+)
 
 
 def get_sugar_info(molecule: any) -> tuple:
@@ -17,12 +25,8 @@ def get_sugar_info(molecule: any) -> tuple:
         tuple: A tuple containing two boolean values indicating whether the molecule has linear sugars
                and whether the molecule has circular sugars. If no sugars are found, both values will be False.
     """
-    SCOB = cdk.JClass(cdk.cdk_base + ".silent.SilentChemObjectBuilder")
-
-    sru_base = "de.unijena.cheminf.deglycosylation"
-
-    SugarRemovalUtility = cdk.JClass(sru_base + ".SugarRemovalUtility")(
-        SCOB.getInstance(),
+    SugarRemovalUtility = _SugarRemovalUtility(
+        get_chem_object_builder(),
     )
     hasCircularOrLinearSugars = SugarRemovalUtility.hasCircularOrLinearSugars(
         molecule,
@@ -53,17 +57,8 @@ def remove_linear_sugar(molecule: any) -> str:
         ValueError: If there is an issue with parsing the input SMILES string.
     """
 
-    cdk_base = "org.openscience.cdk"
-    SCOB = cdk.JClass(cdk_base + ".silent.SilentChemObjectBuilder")
-    SmiFlavor = cdk.JClass(cdk_base + ".smiles.SmiFlavor")
-    SmilesGenerator = cdk.JClass(cdk_base + ".smiles.SmilesGenerator")(
-        SmiFlavor.Absolute,
-    )
-
-    sru_base = "de.unijena.cheminf.deglycosylation"
-
-    SugarRemovalUtility = cdk.JClass(sru_base + ".SugarRemovalUtility")(
-        SCOB.getInstance(),
+    SugarRemovalUtility = _SugarRemovalUtility(
+        get_chem_object_builder(),
     )
     hasLinearSugar = SugarRemovalUtility.hasLinearSugars(molecule)
 
@@ -73,8 +68,8 @@ def remove_linear_sugar(molecule: any) -> str:
             True,
         )
         if not MoleculeWithoutSugars.isEmpty():
-            L_SMILES = SmilesGenerator.create(MoleculeWithoutSugars)
-            return str(L_SMILES)
+            L_SMILES = get_absolute_SMILES(MoleculeWithoutSugars)
+            return L_SMILES
         else:
             return ""
     else:
@@ -92,17 +87,8 @@ def remove_circular_sugar(molecule: any) -> str:
     Returns:
         str: SMILES string with circular sugars removed, or a message if no circular sugars are found.
     """
-    cdk_base = "org.openscience.cdk"
-    SCOB = cdk.JClass(cdk_base + ".silent.SilentChemObjectBuilder")
-    SmiFlavor = cdk.JClass(cdk_base + ".smiles.SmiFlavor")
-    SmilesGenerator = cdk.JClass(cdk_base + ".smiles.SmilesGenerator")(
-        SmiFlavor.Absolute,
-    )
-
-    sru_base = "de.unijena.cheminf.deglycosylation"
-
-    SugarRemovalUtility = cdk.JClass(sru_base + ".SugarRemovalUtility")(
-        SCOB.getInstance(),
+    SugarRemovalUtility = _SugarRemovalUtility(
+        get_chem_object_builder(),
     )
     hasCircularSugar = SugarRemovalUtility.hasCircularSugars(molecule)
 
@@ -115,8 +101,8 @@ def remove_circular_sugar(molecule: any) -> str:
             True,
         )
         if not MoleculeWithoutSugars.isEmpty():
-            C_SMILES = SmilesGenerator.create(MoleculeWithoutSugars)
-            return str(C_SMILES)
+            C_SMILES = get_absolute_SMILES(MoleculeWithoutSugars)
+            return C_SMILES
         else:
             return ""
     else:
@@ -135,17 +121,8 @@ def remove_linear_and_circular_sugar(molecule: any):
     Returns:
         smiles (str): SMILES string without linear and circular sugars.
     """
-    cdk_base = "org.openscience.cdk"
-    SCOB = cdk.JClass(cdk_base + ".silent.SilentChemObjectBuilder")
-    SmiFlavor = cdk.JClass(cdk_base + ".smiles.SmiFlavor")
-    SmilesGenerator = cdk.JClass(cdk_base + ".smiles.SmilesGenerator")(
-        SmiFlavor.Absolute,
-    )
-
-    sru_base = "de.unijena.cheminf.deglycosylation"
-
-    SugarRemovalUtility = cdk.JClass(sru_base + ".SugarRemovalUtility")(
-        SCOB.getInstance(),
+    SugarRemovalUtility = _SugarRemovalUtility(
+        get_chem_object_builder(),
     )
     hasCircularOrLinearSugars = SugarRemovalUtility.hasCircularOrLinearSugars(
         molecule,
@@ -161,8 +138,8 @@ def remove_linear_and_circular_sugar(molecule: any):
         )
         if not MoleculeWithoutSugars.isEmpty():
             try:
-                S_SMILES = SmilesGenerator.create(MoleculeWithoutSugars)
-                return str(S_SMILES)
+                S_SMILES = get_absolute_SMILES(MoleculeWithoutSugars)
+                return S_SMILES
             except Exception as e:
                 raise Exception(f"{str(e)}")
         else:
@@ -1,51 +1,58 @@
 from __future__ import annotations
 
-import io
+import asyncio
+import functools
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Annotated
+from typing import List
 from typing import Literal
 from typing import Optional
 from typing import Union
 
-import pandas as pd
-from chembl_structure_pipeline import checker
-from chembl_structure_pipeline import standardizer
+import orjson
 from fastapi import APIRouter
 from fastapi import Body
 from fastapi import HTTPException
 from fastapi import Query
 from fastapi import status
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.responses import Response
+from fastapi.responses import StreamingResponse
 from fastapi.templating import Jinja2Templates
 from rdkit import Chem
 from rdkit.Chem.EnumerateStereoisomers import (
     EnumerateStereoisomers,
 )
+from rdkit.Chem.EnumerateStereoisomers import StereoEnumerationOptions
 
+from app.http_cache import cacheable
+from app.http_cache import CacheableRoute
 from app.modules.all_descriptors import get_tanimoto_similarity
 from app.modules.classyfire import classify
 from app.modules.classyfire import result
 from app.modules.coconut.descriptors import get_COCONUT_descriptors
+from app.modules.coconut.descriptors import get_COCONUT_descriptors_batch
 from app.modules.coconut.preprocess import get_COCONUT_preprocessing
+from app.modules.filters import FILTER_BATCH_SIZE
+from app.modules.filters import get_filter_results_batch
+from app.modules.filters import parse_range
 from app.modules.npscorer import get_np_score
 from app.modules.toolkits.cdk_wrapper import get_CDK_HOSE_codes
 from app.modules.toolkits.cdk_wrapper import get_tanimoto_similarity_CDK
 from app.modules.toolkits.helpers import parse_input
-from app.modules.toolkits.rdkit_wrapper import check_RO5_violations
 from app.modules.toolkits.rdkit_wrapper import get_ertl_functional_groups
-from app.modules.toolkits.rdkit_wrapper import get_GhoseFilter
-from app.modules.toolkits.rdkit_wrapper import get_PAINS
 from app.modules.toolkits.rdkit_wrapper import get_properties
 from app.modules.toolkits.rdkit_wrapper import get_rdkit_HOSE_codes
-from app.modules.toolkits.rdkit_wrapper import get_REOSFilter
-from app.modules.toolkits.rdkit_wrapper import get_RuleofThree
-from app.modules.toolkits.rdkit_wrapper import get_sas_score
 from app.modules.toolkits.rdkit_wrapper import get_tanimoto_similarity_rdkit
-from app.modules.toolkits.rdkit_wrapper import get_VeberFilter
 from app.modules.toolkits.rdkit_wrapper import get_standardized_tautomer
-from app.modules.toolkits.rdkit_wrapper import QED
+from app.modules.toolkits.rdkit_wrapper import read_SDF_record
 from app.schemas import HealthCheck
 from app.schemas.chem_schema import FilteredMoleculesResponse
+from app.schemas.chem_schema import GenerateBatchDescriptorsResponse
 from app.schemas.chem_schema import GenerateDescriptorsResponse
 from app.schemas.chem_schema import GenerateFunctionalGroupResponse
 from app.schemas.chem_schema import GenerateHOSECodeResponse
@@ -69,6 +76,8 @@ router = APIRouter(
     prefix="/chem",
     tags=["chem"],
     dependencies=[],
+    default_response_class=ORJSONResponse,
+    route_class=CacheableRoute,
     responses={
         200: {"description": "OK"},
         400: {"description": "Bad Request", "model": BadRequestModel},
@@ -79,6 +88,75 @@ router = APIRouter(
 
 templates = Jinja2Templates(directory="app/templates")
 
+with open("app/templates/style.css", "r") as file:
+    css_style = file.read()
+
+_descriptors_template = templates.get_template("descriptors.html")
+
+
+def _format_table_value(value) -> str:
+    """Format a descriptor value the way pandas renders it in an HTML table."""
+    if isinstance(value, float):
+        if math.isnan(value):
+            return "NaN"
+        if math.isinf(value):
+            return str(value)
+        # Six decimals with trailing zeros trimmed, keeping at least one
+        formatted = f"{value:.6f}".rstrip("0")
+        return formatted + "0" if formatted.endswith(".") else formatted
+    return str(value)
+
+
+# Isomeric canonical SMILES, the same output as MolToSmiles' defaults
+_isomer_smiles_params = Chem.SmilesWriteParams()
+_isomer_smiles_params.doIsomericSmiles = True
+
+
+# The ChEMBL checker and standardizer are deterministic and return immutable
+# results, so repeated structures are answered from a cache. The pipeline is
+# imported on first use to keep it out of the worker start-up.
+@functools.lru_cache(maxsize=8192)
+def _check_molblock(mol_block: str) -> tuple:
+    """Run the ChEMBL structure checker on a molblock."""
+    from chembl_structure_pipeline import checker
+
+    return checker.check_molblock(mol_block)
+
+
+@functools.lru_cache(maxsize=8192)
+def _standardize_molblock(mol_block: str) -> str:
+    """Standardize a molblock using the ChEMBL curation pipeline."""
+    from chembl_structure_pipeline import standardizer
+
+    return standardizer.standardize_molblock(mol_block)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_filter_executor() -> ProcessPoolExecutor:
+    """Return the process pool used to evaluate large filter requests.
+
+    The filters are CPU bound RDKit calls that hold the GIL, so they are
+    spread over processes. The workers are spawned rather than forked, as
+    forking a process with a running JVM is not safe.
+    """
+    return ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def _reset_filter_executor(executor: ProcessPoolExecutor) -> None:
+    """Drop a broken process pool so that _get_filter_executor creates a new one.
+
+    Only called from the event loop, like _get_filter_executor, so another
+    request can't replace the pool in between.
+    """
+    if _get_filter_executor.cache_info().currsize and (
+        _get_filter_executor() is executor
+    ):
+        _get_filter_executor.cache_clear()
+    executor.shutdown(wait=False, cancel_futures=True)
+
 
 @router.get("/", include_in_schema=False)
 @router.get(
@@ -116,7 +194,8 @@ def get_health() -> HealthCheck:
         422: {"description": "Unprocessable Entity", "model": ErrorResponse},
     },
 )
-async def get_stereoisomers(
+@cacheable()
+def get_stereoisomers(
     smiles: str = Query(
         title="SMILES",
         description="SMILES string to be enumerated",
@@ -131,6 +210,13 @@ async def get_stereoisomers(
             },
         },
     ),
+    max_isomers: Optional[int] = Query(
+        default=1024,
+        ge=1,
+        le=4096,
+        title="Maximum number of isomers",
+        description="Maximum number of stereoisomers to enumerate",
+    ),
 ):
     """For a given SMILES string this function enumerates all possible.
 
@@ -138,6 +224,7 @@ async def get_stereoisomers(
 
     Parameters:
     - **SMILES**: required (query parameter): The SMILES string to be enumerated.
+    - **max_isomers**: optional (query parameter): Maximum number of stereoisomers to enumerate. Defaults to 1024, at most 4096. Larger sets are randomly sampled, so fewer isomers may be returned.
 
     Returns:
     - List[str]: A list of stereoisomer SMILES strings if successful, otherwise returns an error message.
@@ -147,10 +234,20 @@ async def get_stereoisomers(
     """
     mol = parse_input(smiles, "rdkit", False)
     if mol:
-        isomers = tuple(EnumerateStereoisomers(mol))
-        smilesArray = []
-        for smi in sorted(Chem.MolToSmiles(x, isomericSmiles=True) for x in isomers):
-            smilesArray.append(smi)
+        # Only the SMILES are kept, the isomers are written out one at a time.
+        # Duplicates are dropped here instead of by RDKit: its uniqueness
+        # check writes a second SMILES per isomer and, once there are more
+        # than max_isomers candidates, keeps sampling until it has found
+        # max_isomers distinct ones, which for symmetric molecules can mean
+        # going through all 2^n of them. Without it at most max_isomers
+        # isomers are generated.
+        options = StereoEnumerationOptions(maxIsomers=max_isomers, unique=False)
+        smilesArray = sorted(
+            {
+                Chem.MolToSmiles(isomer, _isomer_smiles_params)
+                for isomer in EnumerateStereoisomers(mol, options=options)
+            }
+        )
         return smilesArray
 
 
@@ -167,7 +264,8 @@ async def get_stereoisomers(
         422: {"description": "Unprocessable Entity", "model": ErrorResponse},
     },
 )
-async def get_descriptors(
+@cacheable()
+def get_descriptors(
     smiles: str = Query(
         title="SMILES",
         description="SMILES representation of the molecule",
@@ -215,29 +313,18 @@ async def get_descriptors(
                 "RDKit Descriptors",
                 "CDK Descriptors",
             ]
-            df = pd.DataFrame.from_dict(
-                data,
-                orient="index",
-                columns=headers[1:],
-                dtype=object,
-            )
-            df.insert(0, headers[0], df.index)
+            rows = [[name, *values] for name, values in data.items()]
         else:
             headers = ["Descriptor name", "Values"]
-            df = pd.DataFrame.from_dict(
-                data,
-                orient="index",
-                columns=headers[1:],
-            )
-            df.insert(0, headers[0], df.index)
+            rows = [[name, value] for name, value in data.items()]
 
-        with open("app/templates/style.css", "r") as file:
-            css_style = file.read()
-
-        html_table = df.to_html(index=False)
+        html_table = _descriptors_template.render(
+            headers=headers,
+            rows=[[_format_table_value(cell) for cell in row] for row in rows],
+        )
         return Response(content=css_style + html_table, media_type="text/html")
     else:
-        return JSONResponse(content=data)
+        return ORJSONResponse(content=data)
 
 
 @router.get(
@@ -301,14 +388,82 @@ async def get_multiple_descriptors(
             detail="At least two molecules are required.",
         )
 
-    descriptors_dict = {}
+    # Repeated SMILES end up under the same key anyway
+    molecules = list(dict.fromkeys(molecules))
+    descriptors = await asyncio.get_running_loop().run_in_executor(
+        None,
+        get_COCONUT_descriptors_batch,
+        molecules,
+        toolkit,
+    )
+    descriptors_dict = dict(zip(molecules, descriptors))
+
+    return ORJSONResponse(content=descriptors_dict)
+
+
+@router.post(
+    "/descriptors/batch",
+    summary="Generates descriptors for a batch of input molecules",
+    responses={
+        200: {
+            "description": "Successful response",
+            "model": GenerateBatchDescriptorsResponse,
+        },
+        400: {"description": "Bad Request", "model": BadRequestModel},
+        404: {"description": "Not Found", "model": NotFoundModel},
+        422: {"description": "Unprocessable Entity", "model": ErrorResponse},
+    },
+)
+async def get_batch_descriptors(
+    smiles: List[str] = Body(
+        embed=True,
+        title="SMILES",
+        description="SMILES representations of the molecules",
+        openapi_examples={
+            "example1": {
+                "summary": "Example: Caffeine, Topiramate-13C6",
+                "value": {
+                    "smiles": [
+                        "CN1C=NC2=C1C(=O)N(C(=O)N2C)C",
+                        "CC1(C)OC2COC3(COS(N)(=O)=O)OC(C)(C)OC3C2O1",
+                    ],
+                },
+            },
+        },
+    ),
+    toolkit: Literal["cdk", "rdkit"] = Query(
+        default="rdkit",
+        description="Cheminformatics toolkit used in the backend",
+    ),
+):
+    """Generates standard descriptors for a batch of input molecules (SMILES).
+
+    Parameters:
+    - **smiles**: required (body): JSON object with a list of SMILES strings, e.g. {"smiles": ["CCO", "CCN"]}.
+    - **toolkit**: optional (query): Toolkit to use for descriptor calculation.
+        - Supported values: "cdk" / "rdkit" (default).
+
+    Returns:
+    - List[Dict[str, Any]]: The descriptors of each molecule in the order of the input SMILES.
+
+    Raises:
+    - ValueError: If the SMILES list is empty or contains an invalid SMILES string.
+    """
+    if not smiles:
+        raise HTTPException(
+            status_code=422,
+            detail="At least one molecule is required.",
+        )
 
-    for molecule in molecules:
-        descriptors = get_COCONUT_descriptors(molecule, toolkit)
-        # print(type(descriptors))
-        descriptors_dict[molecule] = descriptors
+    molecules = [m.strip() for m in smiles]
+    descriptors = await asyncio.get_running_loop().run_in_executor(
+        None,
+        get_COCONUT_descriptors_batch,
+        molecules,
+        toolkit,
+    )
 
-    return JSONResponse(content=descriptors_dict)
+    return ORJSONResponse(content=descriptors)
 
 
 @router.get(
@@ -324,6 +479,7 @@ async def get_multiple_descriptors(
         422: {"description": "Unprocessable Entity", "model": ErrorResponse},
     },
 )
+@cacheable()
 async def hose_codes(
     smiles: str = Query(
         title="SMILES",
@@ -403,7 +559,7 @@ async def hose_codes(
         422: {"description": "Unprocessable Entity", "model": ErrorResponse},
     },
 )
-async def standardize_mol(
+def standardize_mol(
     data: Annotated[
         str,
         Body(
@@ -422,6 +578,10 @@ M  END""",
             },
         ),
     ],
+    kekule: bool = Query(
+        default=True,
+        description="Flag indicating whether to write the canonical SMILES in Kekulé form",
+    ),
 ):
     """Standardize molblock using the ChEMBL curation pipeline.
 
@@ -429,6 +589,7 @@ M  END""",
 
     Parameters:
     - **molblock**: The request body containing the "molblock" string representing the molecule to be standardized.
+    - **kekule**: optional (bool): Whether to write the canonical SMILES in Kekulé form instead of the aromatic form. Defaults to True.
 
     Returns:
     - dict: A dictionary containing the following keys:
@@ -442,12 +603,10 @@ M  END""",
     """
     try:
         if data:
-            suppl = Chem.SDMolSupplier()
-            suppl.SetData(data.encode("utf-8"))
-            if len(suppl) == 1 and suppl[0]:
-                mol_data = suppl[0]
-            mol = Chem.MolToMolBlock(mol_data)
-            standardized_mol = standardizer.standardize_molblock(mol)
+            # The standardizer parses the molblock itself, the RDKit molecule
+            # is only read for its SD properties
+            original_mol = read_SDF_record(data)
+            standardized_mol = _standardize_molblock(data)
             rdkit_mol = Chem.MolFromMolBlock(standardized_mol)
 
         else:
@@ -457,14 +616,16 @@ M  END""",
             )
 
         if rdkit_mol:
-            smiles = Chem.MolToSmiles(rdkit_mol, kekuleSmiles=True)
+            smiles = Chem.MolToSmiles(rdkit_mol, kekuleSmiles=kekule)
+            # The InChIKey is derived from the InChI, generate that only once
+            inchi = Chem.inchi.MolToInchi(rdkit_mol)
             response = dict(
                 standardized_mol=standardized_mol,
                 canonical_smiles=smiles,
-                inchi=Chem.inchi.MolToInchi(rdkit_mol),
-                inchikey=Chem.inchi.MolToInchiKey(rdkit_mol),
+                inchi=inchi,
+                inchikey=Chem.inchi.InchiToInchiKey(inchi),
             )
-            original_properties = get_properties(data)
+            original_properties = get_properties(original_mol)
             response.update(original_properties)
             return response
 
@@ -485,7 +646,7 @@ M  END""",
         422: {"description": "Unprocessable Entity", "model": ErrorResponse},
     },
 )
-async def check_errors(
+def check_errors(
     smiles: str = Query(
         title="SMILES",
         description="The SMILES string to check and standardize.",
@@ -534,12 +695,12 @@ async def check_errors(
     mol = Chem.MolFromSmiles(smiles, sanitize=False)
     if mol:
         mol_block = Chem.MolToMolBlock(mol)
-        issues = checker.check_molblock(mol_block)
+        issues = _check_molblock(mol_block)
 
         if issues:
             if fix:
-                standardized_mol = standardizer.standardize_molblock(mol_block)
-                issues_new = checker.check_molblock(standardized_mol)
+                standardized_mol = _standardize_molblock(mol_block)
+                issues_new = _check_molblock(standardized_mol)
                 rdkit_mol = Chem.MolFromMolBlock(standardized_mol)
                 standardized_smiles = Chem.MolToSmiles(rdkit_mol)
                 result = SMILESStandardizedResult(
@@ -577,7 +738,8 @@ async def check_errors(
         422: {"description": "Unprocessable Entity", "model": ErrorResponse},
     },
 )
-async def np_likeness_score(
+@cacheable()
+def np_likeness_score(
     smiles: str = Query(
         title="SMILES",
         description="The SMILES string to calculate the natural product likeness score",
@@ -628,7 +790,8 @@ async def np_likeness_score(
         422: {"description": "Unprocessable Entity", "model": ErrorResponse},
     },
 )
-async def tanimoto_similarity(
+@cacheable()
+def tanimoto_similarity(
     smiles: str = Query(
         title="SMILES",
         description="SMILES representation of the molecules",
@@ -691,11 +854,18 @@ async def tanimoto_similarity(
         )
 
     elif len(smiles.split(",")) == 2:
+        smiles1, smiles2 = smiles.split(",")
         try:
-            smiles1, smiles2 = smiles.split(",")
             if toolkit == "rdkit":
                 mol1 = parse_input(smiles1, "rdkit", False)
                 mol2 = parse_input(smiles2, "rdkit", False)
+                # Identical molecules have identical ECFP fingerprints, which
+                # are never empty, so fingerprinting can be skipped
+                if fingerprinter == "ECFP" and (
+                    smiles1.strip() == smiles2.strip()
+                    or Chem.MolToSmiles(mol1) == Chem.MolToSmiles(mol2)
+                ):
+                    return 1.0
                 Tanimoto = get_tanimoto_similarity_rdkit(
                     mol1,
                     mol2,
@@ -749,7 +919,7 @@ async def tanimoto_similarity(
         422: {"description": "Unprocessable Entity", "model": ErrorResponse},
     },
 )
-async def coconut_preprocessing(
+def coconut_preprocessing(
     smiles: str = Query(
         ...,
         title="SMILES",
@@ -972,88 +1142,79 @@ async def all_filter_molecules(
         title="NPlikenessScore",
         description="Calculate NPlikenessScore in the range (e.g., 0-10)",
     ),
+    short_circuit: bool = Query(
+        False,
+        title="Short-circuit",
+        description="Only return the molecules passing all selected filters (without a PAINS match), evaluating the cheapest filters first and stopping at the first failure (true or false)",
+    ),
+    output_format: Literal["json", "ndjson"] = Query(
+        default="json",
+        alias="format",
+        description="Return a JSON list, or stream one JSON object with the input index and result per line as the molecules are evaluated",
+    ),
 ):
-    all_smiles = []
-    for item in io.StringIO(smiles_list):
-        smiles = item.strip()
-        mol = parse_input(smiles, "rdkit", False)
-        results = []
-        results.append(smiles + ":")
-        if mol:
-            if pains:
-                pains_status = str(get_PAINS(mol))
-                if "family" in pains_status:
-                    results.append("True")
-                else:
-                    results.append("False")
-            if lipinski:
-                lipinski_violations = check_RO5_violations(mol)
-                if lipinski_violations == 0:
-                    results.append("True")
-                else:
-                    results.append("False")
-
-            if veber:
-                if get_VeberFilter(mol) == "True":
-                    results.append("True")
-                else:
-                    results.append("False")
-            if reos:
-                if get_REOSFilter(mol) == "True":
-                    results.append("True")
-                else:
-                    results.append("False")
-
-            if ghose:
-                if get_GhoseFilter(mol) == "True":
-                    results.append("True")
-                else:
-                    results.append("False")
-
-            if ruleofthree:
-                if get_RuleofThree(mol) == "True":
-                    results.append("True")
-                else:
-                    results.append("False")
-
-            if len(qedscore.split("-")) == 2:
-                range_start, range_end = float(qedscore.split("-")[0]), float(
-                    qedscore.split("-")[1],
-                )
-                qed_value = QED.qed(mol)
-                if range_start <= qed_value <= range_end:
-                    results.append("True")
-                else:
-                    results.append("False")
-
-            if len(sascore.split("-")) == 2:
-                range_start, range_end = float(sascore.split("-")[0]), float(
-                    sascore.split("-")[1],
-                )
-                sascore_value = get_sas_score(mol)
-                if range_start <= sascore_value <= range_end:
-                    results.append("True")
-                else:
-                    results.append("False")
-
-            if len(nplikeness.split("-")) == 2:
-                range_start, range_end = float(nplikeness.split("-")[0]), float(
-                    nplikeness.split("-")[1],
-                )
-                nplikeness_value = get_np_score(mol)
-                if range_start <= float(nplikeness_value) <= range_end:
-                    results.append("True")
-                else:
-                    results.append("False")
-
-            output_list = [
-                x if x != "True" and x != "False" else ("T" if x == "True" else "F")
-                for x in results
-            ]
-            final_results = ", ".join(output_list).replace(":,", " : ")
-            all_smiles.append(final_results)
-
-    return all_smiles
+    all_smiles = [item.strip() for item in smiles_list.splitlines() if item.strip()]
+    qedscore = parse_range("qedscore", qedscore)
+    sascore = parse_range("sascore", sascore)
+    nplikeness = parse_range("nplikeness", nplikeness)
+    # Repeated SMILES are evaluated once and their result is copied to every
+    # position they occur at.
+    positions = {}
+    for index, smiles in enumerate(all_smiles):
+        positions.setdefault(smiles, []).append(index)
+    unique_smiles = list(positions)
+    offsets = range(0, len(unique_smiles), FILTER_BATCH_SIZE)
+    # A single batch is evaluated in a thread, starting the worker processes
+    # only pays off for larger lists.
+    executor = _get_filter_executor() if len(offsets) > 1 else None
+    loop = asyncio.get_running_loop()
+
+    async def evaluate_batch(offset: int) -> tuple:
+        end = offset + FILTER_BATCH_SIZE
+        try:
+            results = await loop.run_in_executor(
+                executor,
+                get_filter_results_batch,
+                unique_smiles[offset:end],
+                pains,
+                lipinski,
+                veber,
+                reos,
+                ghose,
+                ruleofthree,
+                qedscore,
+                sascore,
+                nplikeness,
+                short_circuit,
+            )
+        except BrokenProcessPool:
+            # A broken pool rejects all further work, the next request starts
+            # a new one
+            _reset_filter_executor(executor)
+            raise
+        return offset, results
+
+    if output_format == "ndjson":
+
+        async def stream_results():
+            for batch in asyncio.as_completed(
+                [evaluate_batch(offset) for offset in offsets]
+            ):
+                offset, results = await batch
+                for smiles, row in zip(unique_smiles[offset:], results):
+                    if row is None:
+                        continue
+                    for index in positions[smiles]:
+                        yield orjson.dumps({"index": index, "result": row}) + b"\n"
+
+        return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+    batches = await asyncio.gather(*[evaluate_batch(offset) for offset in offsets])
+    rows = dict(zip(unique_smiles, (row for _, results in batches for row in results)))
+    # Returned as a response so the rows skip FastAPI's jsonable_encoder pass
+    return ORJSONResponse(
+        content=[rows[smiles] for smiles in all_smiles if rows[smiles] is not None],
+    )
 
 
 @router.get(
@@ -1069,7 +1230,7 @@ async def all_filter_molecules(
         422: {"description": "Unprocessable Entity", "model": ErrorResponse},
     },
 )
-async def get_functional_groups(
+def get_functional_groups(
     smiles: str = Query(
         title="SMILES",
         description="SMILES string to be enumerated",
@@ -1125,7 +1286,7 @@ async def get_functional_groups(
         422: {"description": "Unprocessable Entity", "model": ErrorResponse},
     },
 )
-async def get_standardized_tautomer_smiles(
+def get_standardized_tautomer_smiles(
     smiles: str = Query(
         title="SMILES",
         description="SMILES string to be standardized",
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import functools
+from typing import List
 from typing import Literal
 
 import selfies as sf
 from fastapi import FastAPI
 from fastapi import APIRouter
+from fastapi import Body
 from fastapi import HTTPException
 from fastapi import Query
 from fastapi import status
 from fastapi import Request
+from fastapi.responses import ORJSONResponse
 from fastapi.responses import Response
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
@@ -20,16 +24,21 @@ from app.modules.toolkits.cdk_wrapper import get_CDK_SDG_mol
 from app.modules.toolkits.cdk_wrapper import get_CXSMILES
 from app.modules.toolkits.cdk_wrapper import get_InChI
 from app.modules.toolkits.cdk_wrapper import get_smiles_opsin
+from app.modules.toolkits.cdk_wrapper import run_batch
+from app.modules.toolkits.helpers import check_SMILES
 from app.modules.toolkits.helpers import parse_input
 from app.modules.toolkits.openbabel_wrapper import get_ob_canonical_SMILES
+from app.modules.toolkits.openbabel_wrapper import get_ob_formats
 from app.modules.toolkits.openbabel_wrapper import get_ob_InChI
 from app.modules.toolkits.openbabel_wrapper import get_ob_mol
 from app.modules.toolkits.rdkit_wrapper import get_2d_mol
 from app.modules.toolkits.rdkit_wrapper import get_3d_conformers
 from app.modules.toolkits.rdkit_wrapper import get_rdkit_CXSMILES
 from app.schemas import HealthCheck
+from app.schemas.converters_schema import GenerateBatchResponse
 from app.schemas.converters_schema import GenerateCanonicalResponse
 from app.schemas.converters_schema import GenerateCXSMILESResponse
+from app.schemas.converters_schema import GenerateFormatsBatchResponse
 from app.schemas.converters_schema import GenerateFormatsResponse
 from app.schemas.converters_schema import GenerateInChIKeyResponse
 from app.schemas.converters_schema import GenerateInChIResponse
@@ -41,6 +50,9 @@ from app.schemas.error import BadRequestModel
 from app.schemas.error import ErrorResponse
 from app.schemas.error import NotFoundModel
 
+# Largest number of SMILES accepted by the batch endpoints
+MAX_BATCH_SIZE = 1000
+
 # Create the Limiter instance
 limiter = Limiter(key_func=get_remote_address)
 
@@ -55,6 +67,7 @@ router = APIRouter(
     prefix="/convert",
     tags=["convert"],
     dependencies=[],
+    default_response_class=ORJSONResponse,
     responses={
         200: {"description": "OK"},
         400: {"description": "Bad Request", "model": BadRequestModel},
@@ -63,6 +76,109 @@ router = APIRouter(
     },
 )
 
+# SELFIES follow the atom order of the SMILES they are encoded from, so the
+# conversions are cached on the exact input string.
+_encode_selfies = functools.lru_cache(maxsize=8192)(sf.encoder)
+_decode_selfies = functools.lru_cache(maxsize=8192)(sf.decoder)
+
+
+def _get_mol2D(smiles: str, toolkit: str) -> str:
+    """Generate a mol block with 2D coordinates with the given toolkit."""
+    if toolkit == "cdk":
+        mol = parse_input(smiles, "cdk", False)
+        return get_CDK_SDG_mol(mol).replace("$$$$\n", "")
+    elif toolkit == "rdkit":
+        mol = parse_input(smiles, "rdkit", False)
+        return get_2d_mol(mol)
+    check_SMILES(smiles)
+    return get_ob_mol(smiles)
+
+
+def _get_canonical_smiles(smiles: str, toolkit: str) -> str:
+    """Generate the canonical SMILES with the given toolkit."""
+    if toolkit == "cdk":
+        mol = parse_input(smiles, "cdk", False)
+        return get_canonical_SMILES(mol)
+    elif toolkit == "rdkit":
+        mol = parse_input(smiles, "rdkit", False)
+        return Chem.MolToSmiles(mol, kekuleSmiles=True)
+    check_SMILES(smiles)
+    return get_ob_canonical_SMILES(smiles)
+
+
+def _get_inchi(smiles: str, toolkit: str, InChIKey: bool = False) -> str:
+    """Generate the InChI or InChI-Key with the given toolkit."""
+    inchi = None
+    if toolkit == "cdk":
+        mol = parse_input(smiles, "cdk", False)
+        inchi = get_InChI(mol, InChIKey=InChIKey)
+    elif toolkit == "rdkit":
+        mol = parse_input(smiles, "rdkit", False)
+        if mol:
+            inchi = Chem.inchi.MolToInchi(mol)
+            if inchi and InChIKey:
+                inchi = Chem.inchi.InchiToInchiKey(inchi)
+    else:
+        check_SMILES(smiles)
+        inchi = get_ob_InChI(smiles, InChIKey=InChIKey)
+    if inchi:
+        return str(inchi)
+
+
+def _get_formats(smiles: str, toolkit: str) -> dict:
+    """Generate the mol block, canonical SMILES, InChI and InChI-Key with the given toolkit."""
+    if toolkit == "cdk":
+        response = {}
+        mol = parse_input(smiles, "cdk", False)
+        response["mol"] = get_CDK_SDG_mol(mol).replace("$$$$\n", "")
+        response["canonicalsmiles"] = get_canonical_SMILES(mol)
+        response["inchi"] = str(get_InChI(mol))
+        response["inchikey"] = str(get_InChI(mol, InChIKey=True))
+        return response
+    elif toolkit == "rdkit":
+        mol = parse_input(smiles, "rdkit", False)
+        if mol:
+            response = {}
+            response["mol"] = Chem.MolToMolBlock(mol)
+            response["canonicalsmiles"] = Chem.MolToSmiles(
+                mol,
+                kekuleSmiles=True,
+            )
+            response["inchi"] = Chem.inchi.MolToInchi(mol)
+            response["inchikey"] = Chem.inchi.InchiToInchiKey(response["inchi"])
+            return response
+    else:
+        check_SMILES(smiles)
+        return get_ob_formats(smiles)
+
+
+def _convert_batch(function, smiles: List[str], toolkit: str, *args) -> list:
+    """Apply a conversion to a batch of SMILES.
+
+    CDK conversions run on the JVM attached worker threads, so the batch pays
+    for the thread attachment once instead of once per molecule.
+
+    Args:
+        function (callable): Conversion taking the SMILES and the toolkit.
+        smiles (List[str]): SMILES strings given by the user.
+        toolkit (str): The toolkit used for the conversion.
+        *args: Additional positional arguments passed to the function.
+
+    Returns:
+        list: Conversion results in the order of the input SMILES.
+
+    Raises:
+        HTTPException: If the SMILES list is empty.
+    """
+    if not smiles:
+        raise HTTPException(
+            status_code=422,
+            detail="At least one molecule is required.",
+        )
+    if toolkit == "cdk":
+        return run_batch(function, smiles, toolkit, *args)
+    return [function(item, toolkit, *args) for item in smiles]
+
 
 @router.get("/", include_in_schema=False)
 @router.get(
@@ -101,7 +217,7 @@ def get_health() -> HealthCheck:
     },
 )
 @limiter.limit("20/minute")
-async def create2d_coordinates(
+def create2d_coordinates(
     request: Request,
     smiles: str = Query(
         title="SMILES",
@@ -137,25 +253,68 @@ async def create2d_coordinates(
     Raises:
     - ValueError: If the SMILES string is not provided or is invalid.
     """
-    if toolkit == "cdk":
-        mol = parse_input(smiles, "cdk", False)
+    molblock = _get_mol2D(smiles, toolkit)
+    if molblock:
         return Response(
-            content=get_CDK_SDG_mol(mol).replace("$$$$\n", ""),
+            content=molblock,
             media_type="text/plain",
         )
-    elif toolkit == "rdkit":
-        mol = parse_input(smiles, "rdkit", False)
-        return Response(
-            content=get_2d_mol(mol),
-            media_type="text/plain",
-        )
-    else:
-        mol = parse_input(smiles, "rdkit", False)
-        if mol:
-            return Response(
-                content=get_ob_mol(smiles),
-                media_type="text/plain",
-            )
+
+
+@router.post(
+    "/mol2D/batch",
+    summary="Generates 2D Coordinates for a batch of input molecules",
+    responses={
+        200: {
+            "description": "Successful response",
+            "model": GenerateBatchResponse,
+        },
+        400: {"description": "Bad Request", "model": BadRequestModel},
+        404: {"description": "Not Found", "model": NotFoundModel},
+        422: {"description": "Unprocessable Entity", "model": ErrorResponse},
+    },
+)
+@limiter.limit("20/minute")
+def create2d_coordinates_batch(
+    request: Request,
+    smiles: List[str] = Body(
+        embed=True,
+        max_length=MAX_BATCH_SIZE,
+        title="SMILES",
+        description="SMILES representations of the molecules",
+        openapi_examples={
+            "example1": {
+                "summary": "Example: Caffeine, Topiramate-13C6",
+                "value": {
+                    "smiles": [
+                        "CN1C=NC2=C1C(=O)N(C(=O)N2C)C",
+                        "CC1(C)OC2COC3(COS(N)(=O)=O)OC(C)(C)OC3C2O1",
+                    ],
+                },
+            },
+        },
+    ),
+    toolkit: Literal["cdk", "rdkit", "openbabel"] = Query(
+        default="cdk",
+        description="Cheminformatics toolkit used in the backend",
+    ),
+):
+    """Generates 2D Coordinates for a batch of molecules using the CDK.
+
+    Structure diagram generator/RDKit/Open Babel and returns the mol blocks.
+
+    Parameters:
+    - **smiles**: required (body): JSON object with a list of SMILES strings, e.g. {"smiles": ["CCO", "CCN"]}.
+    - **toolkit** (str, optional): The toolkit to use for generating 2D coordinates.
+        - Supported values: "cdk" (default), "rdkit", "openbabel".
+
+    Returns:
+    - List[str]: The generated mol blocks in the order of the input SMILES.
+
+    Raises:
+    - ValueError: If the SMILES list is empty, longer than 1000 entries or contains an invalid SMILES string.
+    """
+    return _convert_batch(_get_mol2D, smiles, toolkit)
 
 
 @router.get(
@@ -172,7 +331,7 @@ async def create2d_coordinates(
     },
 )
 @limiter.limit("20/minute")
-async def create3d_coordinates(
+def create3d_coordinates(
     request: Request,
     smiles: str = Query(
         title="SMILES",
@@ -216,12 +375,11 @@ async def create3d_coordinates(
             media_type="text/plain",
         )
     elif toolkit == "openbabel":
-        mol = parse_input(smiles, "rdkit", False)
-        if mol:
-            return Response(
-                content=get_ob_mol(smiles, threeD=True),
-                media_type="text/plain",
-            )
+        check_SMILES(smiles)
+        return Response(
+            content=get_ob_mol(smiles, threeD=True),
+            media_type="text/plain",
+        )
 
 
 @router.get(
@@ -238,7 +396,7 @@ async def create3d_coordinates(
     },
 )
 @limiter.limit("10/minute")
-async def iupac_name_or_selfies_to_smiles(
+def iupac_name_or_selfies_to_smiles(
     request: Request,
     input_text: str = Query(
         title="Input IUPAC name or SELFIES",
@@ -287,11 +445,11 @@ async def iupac_name_or_selfies_to_smiles(
             if converter == "opsin":
                 iupac_name = get_smiles_opsin(input_text)
             if iupac_name:
-                return str(iupac_name)
+                return iupac_name
         elif representation == "selfies":
-            selfies_out = sf.decoder(input_text)
+            selfies_out = _decode_selfies(input_text)
             if selfies_out:
-                return str(selfies_out)
+                return selfies_out
         else:
             raise HTTPException(
                 status_code=422,
@@ -314,7 +472,7 @@ async def iupac_name_or_selfies_to_smiles(
         422: {"description": "Unprocessable Entity", "model": ErrorResponse},
     },
 )
-async def smiles_canonicalise(
+def smiles_canonicalise(
     smiles: str = Query(
         title="SMILES",
         description="SMILES representation of the molecule",
@@ -348,15 +506,61 @@ async def smiles_canonicalise(
     - ValueError: If the SMILES string is empty or contains invalid characters.
     - ValueError: If an unsupported toolkit option is provided.
     """
-    if toolkit == "cdk":
-        mol = parse_input(smiles, "cdk", False)
-        return str(get_canonical_SMILES(mol))
-    elif toolkit == "rdkit":
-        mol = parse_input(smiles, "rdkit", False)
-        return str(Chem.MolToSmiles(mol, kekuleSmiles=True))
-    elif toolkit == "openbabel":
-        smiles = get_ob_canonical_SMILES(smiles)
-        return smiles
+    return _get_canonical_smiles(smiles, toolkit)
+
+
+@router.post(
+    "/canonicalsmiles/batch",
+    summary="Generate CanonicalSMILES for a batch of SMILES",
+    responses={
+        200: {
+            "description": "Successful response",
+            "model": GenerateBatchResponse,
+        },
+        400: {"description": "Bad Request", "model": BadRequestModel},
+        404: {"description": "Not Found", "model": NotFoundModel},
+        422: {"description": "Unprocessable Entity", "model": ErrorResponse},
+    },
+)
+@limiter.limit("20/minute")
+def smiles_canonicalise_batch(
+    request: Request,
+    smiles: List[str] = Body(
+        embed=True,
+        max_length=MAX_BATCH_SIZE,
+        title="SMILES",
+        description="SMILES representations of the molecules",
+        openapi_examples={
+            "example1": {
+                "summary": "Example: Caffeine, Topiramate-13C6",
+                "value": {
+                    "smiles": [
+                        "CN1C=NC2=C1C(=O)N(C(=O)N2C)C",
+                        "CC1(C)OC2COC3(COS(N)(=O)=O)OC(C)(C)OC3C2O1",
+                    ],
+                },
+            },
+        },
+    ),
+    toolkit: Literal["cdk", "rdkit", "openbabel"] = Query(
+        default="cdk",
+        description="Cheminformatics toolkit used in the backend",
+    ),
+):
+    """Canonicalizes a batch of SMILES strings according to the allowed toolkits.
+
+    Parameters:
+    - **smiles**: required (body): JSON object with a list of SMILES strings, e.g. {"smiles": ["CCO", "CCN"]}.
+    - **toolkit**: optional (str): The toolkit to use for canonicalization.
+        - Supported values: "cdk" (default), "rdkit" & "openbabel".
+
+    Returns:
+    - List[str]: The canonicalized SMILES strings in the order of the input SMILES.
+
+    Raises:
+    - ValueError: If the SMILES list is empty, longer than 1000 entries or contains an invalid SMILES string.
+    """
+    return _convert_batch(_get_canonical_smiles, smiles, toolkit)
 
 
 @router.get(
@@ -372,7 +576,7 @@ async def smiles_canonicalise(
         422: {"description": "Unprocessable Entity", "model": ErrorResponse},
     },
 )
-async def smiles_to_cxsmiles(
+def smiles_to_cxsmiles(
     smiles: str = Query(
         title="SMILES",
         description="SMILES representation of the molecule",
@@ -416,12 +620,12 @@ async def smiles_to_cxsmiles(
         mol = parse_input(smiles, "cdk", False)
         cxsmiles = get_CXSMILES(mol)
         if cxsmiles:
-            return str(cxsmiles)
+            return cxsmiles
     else:
         mol = parse_input(smiles, "rdkit", False)
         cxsmiles = get_rdkit_CXSMILES(mol)
         if cxsmiles:
-            return str(cxsmiles)
+            return cxsmiles
 
 
 @router.get(
@@ -437,7 +641,7 @@ async def smiles_to_cxsmiles(
         422: {"description": "Unprocessable Entity", "model": ErrorResponse},
     },
 )
-async def smiles_to_inchi(
+def smiles_to_inchi(
     smiles: str = Query(
         title="SMILES",
         description="SMILES representation of the molecule",
@@ -471,21 +675,61 @@ async def smiles_to_inchi(
     - ValueError: If the SMILES string is empty or contains invalid characters.
     - ValueError: If an unsupported toolkit option is provided.
     """
-    if toolkit == "cdk":
-        mol = parse_input(smiles, "cdk", False)
-        inchi = get_InChI(mol)
-        if inchi:
-            return str(inchi)
-    elif toolkit == "rdkit":
-        mol = parse_input(smiles, "rdkit", False)
-        if mol:
-            inchi = Chem.inchi.MolToInchi(mol)
-            if inchi:
-                return str(inchi)
-    elif toolkit == "openbabel":
-        inchi = get_ob_InChI(smiles)
-        if inchi:
-            return str(inchi)
+    return _get_inchi(smiles, toolkit)
+
+
+@router.post(
+    "/inchi/batch",
+    summary="Generate InChIs for a batch of SMILES",
+    responses={
+        200: {
+            "description": "Successful response",
+            "model": GenerateBatchResponse,
+        },
+        400: {"description": "Bad Request", "model": BadRequestModel},
+        404: {"description": "Not Found", "model": NotFoundModel},
+        422: {"description": "Unprocessable Entity", "model": ErrorResponse},
+    },
+)
+@limiter.limit("20/minute")
+def smiles_to_inchi_batch(
+    request: Request,
+    smiles: List[str] = Body(
+        embed=True,
+        max_length=MAX_BATCH_SIZE,
+        title="SMILES",
+        description="SMILES representations of the molecules",
+        openapi_examples={
+            "example1": {
+                "summary": "Example: Caffeine, Topiramate-13C6",
+                "value": {
+                    "smiles": [
+                        "CN1C=NC2=C1C(=O)N(C(=O)N2C)C",
+                        "CC1(C)OC2COC3(COS(N)(=O)=O)OC(C)(C)OC3C2O1",
+                    ],
+                },
+            },
+        },
+    ),
+    toolkit: Literal["cdk", "rdkit", "openbabel"] = Query(
+        default="cdk",
+        description="Cheminformatics toolkit used in the backend",
+    ),
+):
+    """Convert a batch of SMILES to InChI.
+
+    Parameters:
+    - **smiles**: required (body): JSON object with a list of SMILES strings, e.g. {"smiles": ["CCO", "CCN"]}.
+    - **toolkit**: optional (str): The toolkit to use for conversion.
+        - Supported values: "cdk" (default), "openbabel" & "rdkit".
+
+    Returns:
+    - List[str]: The resulting InChI strings in the order of the input SMILES.
+
+    Raises:
+    - ValueError: If the SMILES list is empty, longer than 1000 entries or contains an invalid SMILES string.
+    """
+    return _convert_batch(_get_inchi, smiles, toolkit)
 
 
 @router.get(
@@ -501,7 +745,7 @@ async def smiles_to_inchi(
         422: {"description": "Unprocessable Entity", "model": ErrorResponse},
     },
 )
-async def smiles_to_inchikey(
+def smiles_to_inchikey(
     smiles: str = Query(
         title="SMILES",
         description="SMILES representation of the molecule",
@@ -535,22 +779,61 @@ async def smiles_to_inchikey(
     - ValueError: If the SMILES string is empty or contains invalid characters.
     - ValueError: If an unsupported toolkit option is provided.
     """
-    if toolkit == "cdk":
-        mol = parse_input(smiles, "cdk", False)
-        inchikey = get_InChI(mol, InChIKey=True)
-        if inchikey:
-            return str(inchikey)
+    return _get_inchi(smiles, toolkit, True)
 
-    elif toolkit == "rdkit":
-        mol = parse_input(smiles, "rdkit", False)
-        if mol:
-            inchikey = Chem.inchi.MolToInchiKey(mol)
-            if inchikey:
-                return str(inchikey)
-    elif toolkit == "openbabel":
-        inchikey = get_ob_InChI(smiles, InChIKey=True)
-        if inchikey:
-            return str(inchikey)
+
+@router.post(
+    "/inchikey/batch",
+    summary="Generate InChI-Keys for a batch of SMILES",
+    responses={
+        200: {
+            "description": "Successful response",
+            "model": GenerateBatchResponse,
+        },
+        400: {"description": "Bad Request", "model": BadRequestModel},
+        404: {"description": "Not Found", "model": NotFoundModel},
+        422: {"description": "Unprocessable Entity", "model": ErrorResponse},
+    },
+)
+@limiter.limit("20/minute")
+def smiles_to_inchikey_batch(
+    request: Request,
+    smiles: List[str] = Body(
+        embed=True,
+        max_length=MAX_BATCH_SIZE,
+        title="SMILES",
+        description="SMILES representations of the molecules",
+        openapi_examples={
+            "example1": {
+                "summary": "Example: Caffeine, Topiramate-13C6",
+                "value": {
+                    "smiles": [
+                        "CN1C=NC2=C1C(=O)N(C(=O)N2C)C",
+                        "CC1(C)OC2COC3(COS(N)(=O)=O)OC(C)(C)OC3C2O1",
+                    ],
+                },
+            },
+        },
+    ),
+    toolkit: Literal["cdk", "rdkit", "openbabel"] = Query(
+        default="cdk",
+        description="Cheminformatics toolkit used in the backend",
+    ),
+):
+    """Convert a batch of SMILES to InChI-Key.
+
+    Parameters:
+    - **smiles**: required (body): JSON object with a list of SMILES strings, e.g. {"smiles": ["CCO", "CCN"]}.
+    - **toolkit**: optional (str): The toolkit to use for conversion.
+        - Supported values: "cdk" (default), "openbabel" & "rdkit".
+
+    Returns:
+    - List[str]: The resulting InChI-Key strings in the order of the input SMILES.
+
+    Raises:
+    - ValueError: If the SMILES list is empty, longer than 1000 entries or contains an invalid SMILES string.
+    """
+    return _convert_batch(_get_inchi, smiles, toolkit, True)
 
 
 @router.get(
@@ -566,7 +849,7 @@ async def smiles_to_inchikey(
         422: {"description": "Unprocessable Entity", "model": ErrorResponse},
     },
 )
-async def encode_selfies(
+def encode_selfies(
     smiles: str = Query(
         title="SMILES",
         description="SMILES representation of the molecule",
@@ -597,9 +880,9 @@ async def encode_selfies(
     - ValueError: If the SMILES string is empty or contains invalid characters.
     """
     try:
-        selfies_e = sf.encoder(smiles)
+        selfies_e = _encode_selfies(smiles)
         if selfies_e:
-            return str(selfies_e)
+            return selfies_e
         else:
             raise HTTPException(
                 status_code=400,
@@ -609,6 +892,62 @@ async def encode_selfies(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post(
+    "/selfies/batch",
+    summary="Generates SELFIES strings for a batch of SMILES strings",
+    responses={
+        200: {
+            "description": "Successful response",
+            "model": GenerateBatchResponse,
+        },
+        400: {"description": "Bad Request", "model": BadRequestModel},
+        404: {"description": "Not Found", "model": NotFoundModel},
+        422: {"description": "Unprocessable Entity", "model": ErrorResponse},
+    },
+)
+@limiter.limit("20/minute")
+def encode_selfies_batch(
+    request: Request,
+    smiles: List[str] = Body(
+        embed=True,
+        max_length=MAX_BATCH_SIZE,
+        title="SMILES",
+        description="SMILES representations of the molecules",
+        openapi_examples={
+            "example1": {
+                "summary": "Example: Caffeine, Topiramate-13C6",
+                "value": {
+                    "smiles": [
+                        "CN1C=NC2=C1C(=O)N(C(=O)N2C)C",
+                        "CC1(C)OC2COC3(COS(N)(=O)=O)OC(C)(C)OC3C2O1",
+                    ],
+                },
+            },
+        },
+    ),
+):
+    """Generates SELFIES strings for a batch of SMILES strings.
+
+    Parameters:
+    - **smiles**: required (body): JSON object with a list of SMILES strings, e.g. {"smiles": ["CCO", "CCN"]}.
+
+    Returns:
+    - List[str]: The resulting SELFIES in the order of the input SMILES.
+
+    Raises:
+    - ValueError: If the SMILES list is empty, longer than 1000 entries or contains an invalid SMILES string.
+    """
+    if not smiles:
+        raise HTTPException(
+            status_code=422,
+            detail="At least one molecule is required.",
+        )
+    try:
+        return [_encode_selfies(item) for item in smiles]
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get(
     "/formats",
     summary="Convert SMILES to various molecular formats using different toolkits",
@@ -622,7 +961,7 @@ async def encode_selfies(
         422: {"description": "Unprocessable Entity", "model": ErrorResponse},
     },
 )
-async def smiles_convert_to_formats(
+def smiles_convert_to_formats(
     smiles: str = Query(
         title="SMILES",
         description="SMILES representation of the molecule",
@@ -664,39 +1003,72 @@ async def smiles_convert_to_formats(
     - ValueError: If an unsupported toolkit option is provided.
     """
     try:
-        if toolkit == "cdk":
-            response = {}
-            mol = parse_input(smiles, "cdk", False)
-            response["mol"] = get_CDK_SDG_mol(mol).replace("$$$$\n", "")
-            response["canonicalsmiles"] = str(get_canonical_SMILES(mol))
-            response["inchi"] = str(get_InChI(mol))
-            response["inchikey"] = str(get_InChI(mol, InChIKey=True))
-            return response
+        return _get_formats(smiles, toolkit)
+    except Exception as e:
+        raise HTTPException(
+            status_code=422,
+            detail="Error processing request: " + str(e),
+        )
 
-        elif toolkit == "rdkit":
-            mol = parse_input(smiles, "rdkit", False)
-            if mol:
-                response = {}
-                response["mol"] = Chem.MolToMolBlock(mol)
-                response["canonicalsmiles"] = Chem.MolToSmiles(
-                    mol,
-                    kekuleSmiles=True,
-                )
-                response["inchi"] = Chem.inchi.MolToInchi(mol)
-                response["inchikey"] = Chem.inchi.MolToInchiKey(mol)
-                return response
-        elif toolkit == "openbabel":
-            response = {}
-            response["mol"] = get_ob_mol(smiles)
-            response["canonicalsmiles"] = get_ob_canonical_SMILES(smiles)
-            response["inchi"] = get_ob_InChI(smiles)
-            response["inchikey"] = get_ob_InChI(smiles, InChIKey=True)
-            return response
-        else:
-            raise HTTPException(
-                status_code=422,
-                detail="Error reading SMILES string, please check again.",
-            )
+
+@router.post(
+    "/formats/batch",
+    summary="Convert a batch of SMILES to various molecular formats using different toolkits",
+    responses={
+        200: {
+            "description": "Successful response",
+            "model": GenerateFormatsBatchResponse,
+        },
+        400: {"description": "Bad Request", "model": BadRequestModel},
+        404: {"description": "Not Found", "model": NotFoundModel},
+        422: {"description": "Unprocessable Entity", "model": ErrorResponse},
+    },
+)
+@limiter.limit("20/minute")
+def smiles_convert_to_formats_batch(
+    request: Request,
+    smiles: List[str] = Body(
+        embed=True,
+        max_length=MAX_BATCH_SIZE,
+        title="SMILES",
+        description="SMILES representations of the molecules",
+        openapi_examples={
+            "example1": {
+                "summary": "Example: Caffeine, Topiramate-13C6",
+                "value": {
+                    "smiles": [
+                        "CN1C=NC2=C1C(=O)N(C(=O)N2C)C",
+                        "CC1(C)OC2COC3(COS(N)(=O)=O)OC(C)(C)OC3C2O1",
+                    ],
+                },
+            },
+        },
+    ),
+    toolkit: Literal["cdk", "rdkit", "openbabel"] = Query(
+        default="cdk",
+        description="Cheminformatics toolkit used in the backend",
+    ),
+):
+    """Convert a batch of SMILES to various molecular formats using different toolkits.
+
+    Parameters:
+    - **smiles**: required (body): JSON object with a list of SMILES strings, e.g. {"smiles": ["CCO", "CCN"]}.
+    - **toolkit**: optional (str): The toolkit to use for conversion.
+        - Supported values: "cdk" (default), "openbabel" & "rdkit".
+
+    Returns:
+    - List[dict]: The "mol", "canonicalsmiles", "inchi" and "inchikey" of each molecule in the order of the input SMILES.
+
+    Raises:
+    - ValueError: If the SMILES list is empty, longer than 1000 entries or contains an invalid SMILES string.
+    """
+    if not smiles:
+        raise HTTPException(
+            status_code=422,
+            detail="At least one molecule is required.",
+        )
+    try:
+        return _convert_batch(_get_formats, smiles, toolkit)
     except Exception as e:
         raise HTTPException(
             status_code=422,
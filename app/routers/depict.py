@@ -1,33 +1,51 @@
 from __future__ import annotations
 
+import functools
+import gzip
+from typing import List
 from typing import Literal
 from typing import Optional
 
 from fastapi import FastAPI
 from fastapi import APIRouter
+from fastapi import Body
 from fastapi import HTTPException
 from fastapi import Query
 from fastapi import Request
 from fastapi import status
+from fastapi.responses import HTMLResponse
+from fastapi.responses import JSONResponse
 from fastapi.responses import Response
-from fastapi.templating import Jinja2Templates
+from markupsafe import escape
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
+from app.http_cache import accepts_gzip
+from app.http_cache import cacheable
+from app.http_cache import CacheableRoute
 from app.modules.depiction import get_cdk_depiction
+from app.modules.depiction import get_cdk_depiction_batch
 from app.modules.depiction import get_rdkit_depiction
+from app.modules.depiction import get_rdkit_depiction_batch
 from app.modules.toolkits.helpers import parse_input
 from app.modules.toolkits.openbabel_wrapper import get_ob_mol
 from app.modules.toolkits.rdkit_wrapper import get_3d_conformers
 from app.schemas import HealthCheck
+from app.schemas.depict_schema import Depict2DBatchResponse
 from app.schemas.depict_schema import Depict2DResponse
 from app.schemas.depict_schema import Depict3DResponse
 from app.schemas.error import BadRequestModel
 from app.schemas.error import ErrorResponse
 from app.schemas.error import NotFoundModel
 
-templates = Jinja2Templates(directory="app/templates")
+# The 3D viewer page only substitutes the mol block, so the template is split
+# around it once instead of being rendered by Jinja on every request. Jinja
+# drops the trailing newline of a template, the split keeps that behaviour.
+with open("app/templates/mol.html", "r") as file:
+    _mol_html_prefix, _mol_html_suffix = (
+        file.read().removesuffix("\n").split("{{ molecule }}")
+    )
 # Create the Limiter instance
 limiter = Limiter(key_func=get_remote_address)
 
@@ -42,6 +60,7 @@ router = APIRouter(
     prefix="/depict",
     tags=["depict"],
     dependencies=[],
+    route_class=CacheableRoute,
     responses={
         200: {"description": "OK"},
         400: {"description": "Bad Request", "model": BadRequestModel},
@@ -51,6 +70,42 @@ router = APIRouter(
 )
 
 
+@functools.lru_cache(maxsize=1024)
+def _get_2d_depiction(
+    smiles: str,
+    toolkit: str,
+    width: int,
+    height: int,
+    rotate: int,
+    CIP: bool,
+    unicolor: bool,
+    highlight: str,
+) -> tuple:
+    """Depict a molecule, cached on the request parameters.
+
+    Returns:
+        tuple: The SVG image and its gzip compressed version, so that cache
+        hits don't have to compress it again.
+    """
+    if toolkit == "cdk":
+        mol = parse_input(smiles, "cdk", False)
+        depiction = get_cdk_depiction(
+            mol,
+            [width, height],
+            rotate,
+            CIP=CIP,
+            unicolor=unicolor,
+            highlight=highlight,
+        )
+    else:
+        mol = parse_input(smiles, "rdkit", False)
+        depiction = get_rdkit_depiction(
+            mol, [width, height], rotate, unicolor=unicolor, highlight=highlight
+        )
+    svg = depiction.encode()
+    return svg, gzip.compress(svg, compresslevel=6)
+
+
 @router.get("/", include_in_schema=False)
 @router.get(
     "/health",
@@ -87,7 +142,9 @@ def get_health() -> HealthCheck:
         422: {"description": "Unprocessable Entity", "model": ErrorResponse},
     },
 )
-async def depict_2d_molecule(
+@cacheable(gzip=True)
+def depict_2d_molecule(
+    request: Request,
     smiles: str = Query(
         title="SMILES",
         description="SMILES string to be converted",
@@ -167,28 +224,127 @@ async def depict_2d_molecule(
         - The `CIP` parameter controls whether Cahn-Ingold-Prelog (CIP) stereochemistry information should be included / not.
         - The `unicolor` parameter determines whether a single colour is used for the molecule.
     """
+    try:
+        svg, svg_gzip = _get_2d_depiction(
+            smiles, toolkit, width, height, rotate, CIP, unicolor, highlight
+        )
+    except Exception as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    if accepts_gzip(request):
+        return Response(
+            content=svg_gzip,
+            media_type="image/svg+xml",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+    return Response(
+        content=svg,
+        media_type="image/svg+xml",
+        headers={"Vary": "Accept-Encoding"},
+    )
+
+
+@router.post(
+    "/2D/batch",
+    summary="Generates 2D depictions for a batch of molecules",
+    responses={
+        200: {
+            "description": "Successful response",
+            "model": Depict2DBatchResponse,
+        },
+        400: {"description": "Bad Request", "model": BadRequestModel},
+        404: {"description": "Not Found", "model": NotFoundModel},
+        422: {"description": "Unprocessable Entity", "model": ErrorResponse},
+    },
+)
+def depict_2d_molecule_batch(
+    smiles: List[str] = Body(
+        embed=True,
+        title="SMILES",
+        description="SMILES strings to be depicted",
+        openapi_examples={
+            "example1": {
+                "summary": "Example: Caffeine, Topiramate-13C6",
+                "value": {
+                    "smiles": [
+                        "CN1C=NC2=C1C(=O)N(C(=O)N2C)C",
+                        "CC1(C)OC2COC3(COS(N)(=O)=O)OC(C)(C)OC3C2O1",
+                    ],
+                },
+            },
+        },
+    ),
+    toolkit: Literal["cdk", "rdkit"] = Query(
+        default="rdkit",
+        description="Cheminformatics toolkit used in the backend",
+    ),
+    width: Optional[int] = Query(
+        512,
+        title="Width",
+        description="The width of the generated images in pixels.",
+    ),
+    height: Optional[int] = Query(
+        512,
+        title="Height",
+        description="The height of the generated images in pixels.",
+    ),
+    rotate: Optional[int] = Query(
+        0,
+        title="Rotate",
+        description="The rotation angle of the molecules in degrees.",
+    ),
+    CIP: bool = Query(
+        False,
+        title="CIP",
+        description="Whether to include Cahn-Ingold-Prelog (CIP) stereochemistry information.",
+    ),
+    unicolor: bool = Query(
+        False,
+        title="Unicolor",
+        description="Whether to use a single colour for the molecules.",
+    ),
+):
+    """Generates 2D depictions for a batch of molecules using CDK or RDKit.
+
+    Parameters:
+    - **smiles**: required (body): JSON object with a list of SMILES strings, e.g. {"smiles": ["CCO", "CCN"]}.
+    - **toolkit**: (str, optional): The toolkit to use for the depictions.
+        - Supported values: "cdk"/ "rdkit" (default).
+    - **width**: (int, optional): The width of the generated images in pixels. Defaults to 512.
+    - **height**: (int, optional): The height of the generated images in pixels. Defaults to 512.
+    - **rotate**: (int, optional): The rotation angle of the molecules in degrees. Defaults to 0.
+    - CIP (bool, optional): Whether to include Cahn-Ingold-Prelog (CIP) stereochemistry information. Defaults to False.
+    - unicolor (bool, optional): Whether to use a single colour for the molecules. Defaults to False.
+
+    Returns:
+        JSONResponse: A list of SVG images in the order of the input SMILES.
+
+    Raises:
+    - ValueError: If the SMILES list is empty or contains an invalid SMILES string.
+    """
+    if not smiles:
+        raise HTTPException(
+            status_code=422,
+            detail="At least one molecule is required.",
+        )
     try:
         if toolkit == "cdk":
-            mol = parse_input(smiles, "cdk", False)
-            depiction = get_cdk_depiction(
-                mol,
+            molecules = [parse_input(s, "cdk", False) for s in smiles]
+            depictions = get_cdk_depiction_batch(
+                molecules,
                 [width, height],
                 rotate,
                 CIP=CIP,
                 unicolor=unicolor,
-                highlight=highlight,
-            )
-        elif toolkit == "rdkit":
-            mol = parse_input(smiles, "rdkit", False)
-            depiction = get_rdkit_depiction(
-                mol, [width, height], rotate, unicolor=unicolor, highlight=highlight
             )
         else:
-            raise HTTPException(
-                status_code=422,
-                detail="Error reading SMILES string, please check again.",
+            molecules = [parse_input(s, "rdkit", False) for s in smiles]
+            depictions = get_rdkit_depiction_batch(
+                molecules,
+                [width, height],
+                rotate,
+                unicolor=unicolor,
             )
-        return Response(content=depiction, media_type="image/svg+xml")
+        return JSONResponse(content=depictions)
     except Exception as e:
         raise HTTPException(status_code=422, detail=str(e))
 
@@ -207,7 +363,7 @@ async def depict_2d_molecule(
     },
 )
 @limiter.limit("25/minute")
-async def depict_3d_molecule(
+def depict_3d_molecule(
     request: Request,
     smiles: str = Query(
         title="SMILES",
@@ -244,22 +400,20 @@ async def depict_3d_molecule(
 
     Note:
     - The function expects a GET request to the "/3D" endpoint.
-    - The generated depictions are rendered using the "mol.html" template found under the templates directory.
+    - The generated depictions are inserted into the "mol.html" template found under the templates directory.
     """
     try:
         if toolkit == "openbabel":
-            content = {
-                "request": request,
-                "molecule": get_ob_mol(smiles, threeD=True, depict=True),
-            }
+            molecule = get_ob_mol(smiles, threeD=True, depict=True)
         elif toolkit == "rdkit":
             mol = parse_input(smiles, "rdkit", False)
-            content = {"request": request, "molecule": get_3d_conformers(mol)}
+            molecule = get_3d_conformers(mol)
         else:
             raise HTTPException(
                 status_code=422,
                 detail="Error reading SMILES string, please check again.",
             )
-        return templates.TemplateResponse("mol.html", content)
+        # Escaped the same way Jinja's autoescape does
+        return HTMLResponse(_mol_html_prefix + str(escape(molecule)) + _mol_html_suffix)
     except Exception as e:
         raise HTTPException(status_code=422, detail=str(e))
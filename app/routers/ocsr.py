@@ -70,7 +70,7 @@ def get_health() -> HealthCheck:
         422: {"description": "Unprocessable Entity", "model": ErrorResponse},
     },
 )
-async def Extract_ChemicalInfo_From_File(
+def Extract_ChemicalInfo_From_File(
     path: str = Body(
         None,
         embed=True,
@@ -163,7 +163,7 @@ async def Extract_ChemicalInfo_From_File(
         422: {"description": "Unprocessable Entity", "model": ErrorResponse},
     },
 )
-async def extract_chemicalinfo_from_upload(
+def extract_chemicalinfo_from_upload(
     file: Annotated[UploadFile, File(description="Chemical structure depiction image")],
 ):
     """Detect, segment and convert a chemical structure depiction in the.
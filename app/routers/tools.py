@@ -70,7 +70,7 @@ def get_health() -> HealthCheck:
         422: {"description": "Unprocessable Entity", "model": ErrorResponse},
     },
 )
-async def generate_structures(
+def generate_structures(
     molecular_formula: str = Query(
         title="Molecular Formula",
         description="Molecular Formula for the chemical structure to be generated",
@@ -127,7 +127,7 @@ async def generate_structures(
         422: {"description": "Unprocessable Entity", "model": ErrorResponse},
     },
 )
-async def get_sugar_information(
+def get_sugar_information(
     smiles: str = Query(
         title="SMILES",
         description="SMILES: string representation of the molecule",
@@ -190,7 +190,7 @@ async def get_sugar_information(
         422: {"description": "Unprocessable Entity", "model": ErrorResponse},
     },
 )
-async def remove_linear_sugars(
+def remove_linear_sugars(
     smiles: str = Query(
         title="SMILES",
         description="SMILES: string representation of the molecule",
@@ -240,7 +240,7 @@ async def remove_linear_sugars(
         422: {"description": "Unprocessable Entity", "model": ErrorResponse},
     },
 )
-async def remove_circular_sugars(
+def remove_circular_sugars(
     smiles: str = Query(
         title="SMILES",
         description="SMILES: string representation of the molecule",
@@ -293,7 +293,7 @@ async def remove_circular_sugars(
         422: {"description": "Unprocessable Entity", "model": ErrorResponse},
     },
 )
-async def remove_linear_and_circular_sugars(
+def remove_linear_and_circular_sugars(
     smiles: str = Query(
         title="SMILES",
         description="SMILES: string representation of the molecule",
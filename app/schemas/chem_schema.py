@@ -105,6 +105,39 @@ class GenerateMultipleDescriptorsResponse(BaseModel):
         }
 
 
+class GenerateBatchDescriptorsResponse(BaseModel):
+    """Represents a response containing descriptors for a batch of SMILES.
+
+    strings.
+
+    Properties:
+    - descriptors (List[dict]): A list of descriptor dictionaries in the order of the input SMILES.
+    """
+
+    descriptors: List[Dict[str, Any]] = Field(
+        ...,
+        title="Descriptors",
+        description="A list of descriptor dictionaries in the order of the input SMILES.",
+    )
+
+    class Config:
+        """Pydantic model configuration.
+
+        JSON Schema Extra:
+        - Includes examples of the response structure.
+        """
+
+        json_schema_extra = {
+            "examples": [
+                {
+                    "input": '{"smiles": ["CN1C=NC2=C1C(=O)N(C(=O)N2C)C", "CC1(C)OC2COC3(COS(N)(=O)=O)OC(C)(C)OC3C2O1"]}',
+                    "message": "Success",
+                    "output": '[{"A set of calculated molecular descriptors"}, {"A set of calculated molecular descriptors"}]',
+                },
+            ],
+        }
+
+
 class GenerateHOSECodeResponse(BaseModel):
     """Represents a response containing HOSE codes for a molecule.
 
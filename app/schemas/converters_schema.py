@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+from typing import Dict
+from typing import List
+
 from pydantic import BaseModel
 from pydantic import Field
+from pydantic import RootModel
 
 
 class TwoDCoordinatesResponse(BaseModel):
@@ -327,3 +331,52 @@ class GenerateFormatsResponse(BaseModel):
                 },
             ],
         }
+
+
+class GenerateBatchResponse(RootModel[List[str]]):
+    """Represents a response containing the conversions of a batch of SMILES.
+
+    The response is a list of the converted representations in the order of
+    the input SMILES.
+    """
+
+    class Config:
+        """Pydantic model configuration.
+
+        JSON Schema Extra:
+        - Includes examples of the response structure.
+        """
+
+        json_schema_extra = {
+            "examples": [
+                ["InChI=1S/C8H10N4O2/...", "InChI=1S/C2H6O/..."],
+            ],
+        }
+
+
+class GenerateFormatsBatchResponse(RootModel[List[Dict[str, str]]]):
+    """Represents a response containing the formats of a batch of SMILES.
+
+    The response is a list with the mol block, canonical SMILES, InChI and
+    InChI-Key of each molecule in the order of the input SMILES.
+    """
+
+    class Config:
+        """Pydantic model configuration.
+
+        JSON Schema Extra:
+        - Includes examples of the response structure.
+        """
+
+        json_schema_extra = {
+            "examples": [
+                [
+                    {
+                        "mol": "...",
+                        "canonicalsmiles": "CCO",
+                        "inchi": "InChI=1S/C2H6O/c1-2-3/h3H,2H2,1H3",
+                        "inchikey": "LFQSCWFLJHTTHZ-UHFFFAOYSA-N",
+                    },
+                ],
+            ],
+        }
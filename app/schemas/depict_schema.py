@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import List
+
 from pydantic import BaseModel
 
 
@@ -28,6 +30,35 @@ class Depict2DResponse(BaseModel):
         }
 
 
+class Depict2DBatchResponse(BaseModel):
+    """A Pydantic model representing a successful batch response.
+
+    Attributes:
+        message (str): A message indicating the success status (default: "Success").
+        output (List[str]): SVG code blocks of the depicted images in the order of the input SMILES.
+    """
+
+    message: str = "Success"
+    output: List[str]
+
+    class Config:
+        """Pydantic model configuration.
+
+        JSON Schema Extra:
+        - Includes examples of the response structure.
+        """
+
+        json_schema_extra = {
+            "examples": [
+                {
+                    "input": '{"smiles": ["CCCOC", "CCO"]}',
+                    "message": "Success",
+                    "output": ["SVG string", "SVG string"],
+                },
+            ],
+        }
+
+
 class Depict3DResponse(BaseModel):
     """A Pydantic model representing a successful response.
 
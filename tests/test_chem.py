@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import json
+
 import pytest
 from fastapi.testclient import TestClient
+from rdkit import Chem
 
 from app.main import app
 
@@ -58,6 +61,39 @@ def test_smiles_to_stereo_isomers(smiles, response_text, response_code):
         assert response.text == response_text
 
 
+@pytest.mark.parametrize(
+    "max_isomers, response_code",
+    [
+        (2, 200),
+        (5000, 422),
+    ],
+)
+def test_smiles_to_stereo_isomers_max_isomers(max_isomers, response_code):
+    response = client.get(
+        f"/latest/chem/stereoisomers?smiles=CC(O)C(N)CC&max_isomers={max_isomers}"
+    )
+    assert response.status_code == response_code
+    if response_code == 200:
+        assert len(response.json()) == max_isomers
+
+
+def test_smiles_to_stereo_isomers_etag():
+    response = client.get("/latest/chem/stereoisomers?smiles=CC(O)C(N)CC")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"] == "public, max-age=86400, immutable"
+
+    response = client.get("/latest/chem/stereoisomers?smiles=CCC(N)C(C)O")
+    assert response.headers["ETag"] != etag
+
+    response = client.get(
+        "/latest/chem/stereoisomers?smiles=CC(O)C(N)CC",
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+
+
 @pytest.mark.parametrize(
     "smiles, format, response_code",
     [
@@ -108,6 +144,24 @@ def test_smiles_descriptors_multiple(multiple_smiles, toolkit, response_code):
     assert response.status_code == response_code
 
 
+@pytest.mark.parametrize(
+    "smiles_list, toolkit, response_code",
+    [
+        (["CC", "CCO"], "cdk", 200),
+        (["CC", "CCO"], "rdkit", 200),
+        ([], "rdkit", 422),
+    ],
+)
+def test_smiles_descriptors_batch(smiles_list, toolkit, response_code):
+    response = client.post(
+        f"/latest/chem/descriptors/batch?toolkit={toolkit}",
+        json={"smiles": smiles_list},
+    )
+    assert response.status_code == response_code
+    if response_code == 200:
+        assert len(response.json()) == len(smiles_list)
+
+
 @pytest.mark.parametrize(
     "smiles, expected_score, response_code",
     [
@@ -245,6 +299,21 @@ def test_success_standardize_mol(molfile):
     assert "inchikey" in response.json()
 
 
+@pytest.mark.parametrize(
+    "query, canonical_smiles",
+    [("", "C1=CC=CC=C1"), ("?kekule=false", "c1ccccc1")],
+)
+def test_standardize_mol_kekule(query, canonical_smiles):
+    molfile = Chem.MolToMolBlock(Chem.MolFromSmiles("c1ccccc1"))
+    response = client.post(
+        f"/latest/chem/standardize{query}",
+        data=molfile,
+        headers={"Content-Type": "text/plain"},
+    )
+    assert response.status_code == 200
+    assert response.json()["canonical_smiles"] == canonical_smiles
+
+
 @pytest.mark.parametrize(
     "invalid_molfile, exception_response_code",
     [
@@ -360,6 +429,96 @@ def test_all_filter_molecules(test_smiles):
     assert response.status_code == 200
 
 
+def test_all_filter_molecules_ndjson(test_smiles):
+    response = client.post(
+        "/latest/chem/all_filters?format=ndjson",
+        data=test_smiles + "\nCCO",
+        headers={"Content-Type": "text/plain"},
+    )
+    assert response.status_code == 200
+    assert response.headers["Content-Type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["index"] for row in rows] == [0, 1]
+    assert rows[0]["result"].startswith(test_smiles + " : ")
+
+
+def test_all_filter_molecules_duplicates():
+    response = client.post(
+        "/latest/chem/all_filters",
+        data="CCO\nc1ccccc1O\nCCO",
+        headers={"Content-Type": "text/plain"},
+    )
+    assert response.status_code == 200
+    rows = response.json()
+    assert len(rows) == 3
+    assert rows[0] == rows[2]
+    assert rows[1].startswith("c1ccccc1O : ")
+
+    response = client.post(
+        "/latest/chem/all_filters?format=ndjson",
+        data="CCO\nc1ccccc1O\nCCO",
+        headers={"Content-Type": "text/plain"},
+    )
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(row["index"] for row in rows) == [0, 1, 2]
+
+
+def test_all_filter_molecules_several_batches():
+    # More SMILES than fit in one batch are spread over the worker processes
+    smiles = ["C" * length for length in range(1, 151)] + ["CCO", "C"]
+    response = client.post(
+        "/latest/chem/all_filters",
+        data="\n".join(smiles),
+        headers={"Content-Type": "text/plain"},
+    )
+    assert response.status_code == 200
+    rows = response.json()
+    assert len(rows) == len(smiles)
+    for row, item in zip(rows, smiles):
+        assert row.startswith(item + " : ")
+
+    response = client.post(
+        "/latest/chem/all_filters?format=ndjson",
+        data="\n".join(smiles),
+        headers={"Content-Type": "text/plain"},
+    )
+    assert response.status_code == 200
+    results = {}
+    for line in response.text.splitlines():
+        row = json.loads(line)
+        results[row["index"]] = row["result"]
+    assert [results[index] for index in range(len(smiles))] == rows
+
+
+def test_all_filter_molecules_invalid_in_worker():
+    smiles = ["C" * length for length in range(1, 80)] + ["CC\x00O"]
+    response = client.post(
+        "/latest/chem/all_filters",
+        data="\n".join(smiles),
+        headers={"Content-Type": "text/plain"},
+    )
+    assert response.status_code == 422
+
+    # The worker processes are still usable afterwards
+    response = client.post(
+        "/latest/chem/all_filters",
+        data="\n".join(smiles[:-1]),
+        headers={"Content-Type": "text/plain"},
+    )
+    assert response.status_code == 200
+    assert len(response.json()) == len(smiles) - 1
+
+
+def test_all_filter_molecules_short_circuit():
+    response = client.post(
+        "/latest/chem/all_filters?short_circuit=true&pains=false&reos=false&ruleofthree=false",
+        data="CC(=O)Oc1ccccc1C(=O)O\nCCCCCCCCCCCCCCCCCCCC",
+        headers={"Content-Type": "text/plain"},
+    )
+    assert response.status_code == 200
+    assert response.json() == ["CC(=O)Oc1ccccc1C(=O)O :  T, T, T, T, T, T"]
+
+
 def test_get_ertl_functional_groups_invalid_molecule():
     response = client.get("/latest/chem/ertlfunctionalgroup?smiles=CN1C=NC2=C1C(=O)N(")
     assert response.status_code == 422
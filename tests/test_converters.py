@@ -114,6 +114,29 @@ def test_smiles_to_inchi(smiles, toolkit, response_text, response_code):
         assert response.text == response_text
 
 
+@pytest.mark.parametrize(
+    "smiles_list, toolkit, response_code",
+    [
+        (["CN1C=NC2=C1C(=O)N(C(=O)N2C)C", "CCO"], "cdk", 200),
+        (["CN1C=NC2=C1C(=O)N(C(=O)N2C)C", "CCO"], "rdkit", 200),
+        (["CCO", "INVALID_INPUT"], "cdk", 422),
+        ([], "rdkit", 422),
+        (["CCO"] * 1001, "rdkit", 422),
+    ],
+)
+def test_smiles_to_inchi_batch(smiles_list, toolkit, response_code):
+    response = client.post(
+        f"/latest/convert/inchi/batch?toolkit={toolkit}",
+        json={"smiles": smiles_list},
+    )
+    assert response.status_code == response_code
+    if response_code == 200:
+        assert response.json() == [
+            "InChI=1S/C8H10N4O2/c1-10-4-9-6-5(10)7(13)12(3)8(14)11(6)2/h4H,1-3H3",
+            "InChI=1S/C2H6O/c1-2-3/h3H,2H2,1H3",
+        ]
+
+
 @pytest.mark.parametrize(
     "smiles, toolkit, response_text, response_code",
     [
@@ -317,6 +340,25 @@ def test_smiles_to_formats(smiles, toolkit, response_code):
         assert "inchikey" in response.json()
 
 
+@pytest.mark.parametrize(
+    "smiles_list, toolkit, response_code",
+    [
+        (["CN1C=NC2=C1C(=O)N(C(=O)N2C)C", "CCO"], "cdk", 200),
+        (["CN1C=NC2=C1C(=O)N(C(=O)N2C)C", "CCO"], "rdkit", 200),
+        (["CCO", "INVALID_INPUT"], "cdk", 422),
+    ],
+)
+def test_smiles_to_formats_batch(smiles_list, toolkit, response_code):
+    response = client.post(
+        f"/latest/convert/formats/batch?toolkit={toolkit}",
+        json={"smiles": smiles_list},
+    )
+    assert response.status_code == response_code
+    if response_code == 200:
+        assert len(response.json()) == len(smiles_list)
+        assert response.json()[0]["inchikey"] == "RYYVLZVUVIJVGH-UHFFFAOYSA-N"
+
+
 # Filter out DeprecationWarning messages
 @pytest.fixture(autouse=True)
 def ignore_deprecation_warnings():
@@ -39,6 +39,65 @@ def test_depict2D_molecule(
     assert response.status_code == response_code
 
 
+def test_depict2D_molecule_cached():
+    url = "/latest/depict/2D?smiles=CCO&toolkit=rdkit"
+    response = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "svg" in response.text
+    etag = response.headers["ETag"]
+
+    response = client.get(url, headers={"Accept-Encoding": "gzip;q=0, identity"})
+    assert "Content-Encoding" not in response.headers
+    assert "svg" in response.text
+    assert response.headers["ETag"] != etag
+
+    response = client.get(
+        url, headers={"Accept-Encoding": "gzip", "If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+    response = client.get(
+        url, headers={"Accept-Encoding": "identity", "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+
+
+def test_depict2D_molecule_cdk_repeated():
+    url = "/latest/depict/2D?smiles=CCO&toolkit=cdk&width=300&height=200"
+    for _ in range(2):
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.text.startswith("<svg")
+
+    response = client.post(
+        "/latest/depict/2D/batch?toolkit=cdk",
+        json={"smiles": ["CCO", "CCO"]},
+    )
+    assert response.status_code == 200
+    assert response.json()[0] == response.json()[1]
+
+
+@pytest.mark.parametrize(
+    "smiles_list, toolkit, response_code",
+    [
+        (["CCO", "c1ccccc1"], "cdk", 200),
+        (["CCO", "c1ccccc1"], "rdkit", 200),
+        (["CCO", "INVALID_INPUT"], "cdk", 422),
+        ([], "rdkit", 422),
+    ],
+)
+def test_depict2D_molecule_batch(smiles_list, toolkit, response_code):
+    response = client.post(
+        f"/latest/depict/2D/batch?toolkit={toolkit}",
+        json={"smiles": smiles_list},
+    )
+    assert response.status_code == response_code
+    if response_code == 200:
+        assert len(response.json()) == len(smiles_list)
+        assert all("svg" in svg for svg in response.json())
+
+
 @pytest.mark.parametrize(
     "smiles, toolkit,response_code",
     [
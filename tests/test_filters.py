@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import pytest
 
+from app.exception_handlers import InvalidInputException
+from app.modules.filters import parse_range
 from app.modules.toolkits.helpers import parse_input
 from app.modules.toolkits.rdkit_wrapper import check_RO5_violations
+from app.modules.toolkits.rdkit_wrapper import get_filter_descriptors
 from app.modules.toolkits.rdkit_wrapper import get_GhoseFilter
 from app.modules.toolkits.rdkit_wrapper import get_PAINS
 from app.modules.toolkits.rdkit_wrapper import get_REOSFilter
@@ -77,3 +80,28 @@ def test_get_REOSFilter(molecule1, molecule2):
 def test_get_RuleofThree(molecule3, molecule2):
     assert get_RuleofThree(molecule3) is True
     assert get_RuleofThree(molecule2) is False
+
+
+# Test the filters with precalculated descriptors
+def test_filters_with_descriptors(molecule1, molecule2):
+    for molecule in (molecule1, molecule2):
+        descriptors = get_filter_descriptors(molecule)
+        assert check_RO5_violations(molecule, descriptors) == check_RO5_violations(
+            molecule
+        )
+        for filter in (
+            get_GhoseFilter,
+            get_VeberFilter,
+            get_REOSFilter,
+            get_RuleofThree,
+        ):
+            assert filter(molecule, descriptors) is filter(molecule)
+
+
+# Test parse_range
+def test_parse_range():
+    assert parse_range("qedscore", "0-10") == (0.0, 10.0)
+    assert parse_range("qedscore", "0.5-1") == (0.5, 1.0)
+    assert parse_range("qedscore", "10") is None
+    with pytest.raises(InvalidInputException):
+        parse_range("qedscore", "a-b")
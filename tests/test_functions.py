@@ -18,6 +18,7 @@ from app.modules.toolkits.rdkit_wrapper import check_RO5_violations
 from app.modules.toolkits.rdkit_wrapper import get_3d_conformers
 from app.modules.toolkits.rdkit_wrapper import get_ertl_functional_groups
 from app.modules.toolkits.rdkit_wrapper import get_tanimoto_similarity_rdkit
+from app.modules.toolkits.rdkit_wrapper import get_tanimoto_similarity_rdkit_matrix
 
 
 @pytest.fixture
@@ -294,6 +295,20 @@ def test_unsupported_fingerprinter():
     assert "Unsupported fingerprinter!" in result
 
 
+@pytest.mark.parametrize(
+    "fingerprinter",
+    ["ECFP", "RDKit", "Atompairs", "MACCS"],
+)
+def test_tanimoto_similarity_rdkit_matrix(fingerprinter):
+    molecules = [mol1, mol2, mol_without_violations]
+    matrix = get_tanimoto_similarity_rdkit_matrix(molecules, fingerprinter)
+    expected = [
+        [get_tanimoto_similarity_rdkit(a, b, fingerprinter) for b in molecules]
+        for a in molecules
+    ]
+    assert matrix == expected
+
+
 def test_check_RO5_violations():
     violations = check_RO5_violations(mol_with_violations)
     assert violations == 1
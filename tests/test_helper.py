@@ -37,6 +37,18 @@ def test_invalid_smiles():
         parse_input(smiles)
 
 
+@pytest.mark.parametrize("smiles", ["", "   \n", "C" * 10001, "CC\x00O", "C\tCO"])
+def test_invalid_smiles_characters(smiles):
+    with pytest.raises(InvalidInputException):
+        parse_input(smiles)
+
+
+def test_smiles_with_surrounding_whitespace():
+    mol = parse_input("CCO\n")
+    assert mol is not None
+    assert mol.GetNumAtoms() == 3
+
+
 def test_parse_SMILES_invalid_framework(test_smiles):
     with pytest.raises(InvalidInputException):
         parse_input(test_smiles, framework="framework")